@@ -36,6 +36,8 @@ API_KEYS = {
 PROXY_SETTINGS = {
     "enabled": True,
     "proxy_list_file": "config/proxies.txt",
+    "proxy_db_file": "database/proxies.db",  # Shared proxy health between bot processes
+    "max_loaded_proxies": 500,  # Only the fastest N usable proxies are rotated; raise for bigger lists
     "rotate_on_failure": True,
     "max_retries_per_proxy": 3,
     "test_proxies_on_start": True,
@@ -60,9 +62,15 @@ DATABASE_CONFIG = {
 NIKE_CONFIG = {
     "base_url": "https://www.nike.com",
     "login_url": "https://www.nike.com/login",
+    "account_url": "https://www.nike.com/member/settings",
     "snkrs_url": "https://www.nike.com/launch",
     "checkout_delay": (2, 5),  # Random delay range in seconds
     "max_retries": 3,
+    "max_concurrent_bots": 5,  # Bots sharing one browser at a time
+    # Resource types aborted before download; add "stylesheet" if forms still work without CSS
+    "blocked_resource_types": ["image", "font", "media"],
+    "session_state_dir": "state",  # Saved login cookies, one file per account
+    "session_state_max_age": 6 * 3600,  # seconds before a saved login is ignored
     "headless": False,
     "stealth_mode": True,
 }
@@ -81,6 +89,7 @@ ADIDAS_CONFIG = {
 # Shopify Configuration
 SHOPIFY_CONFIG = {
     "monitor_interval": 2,  # seconds between stock checks
+    "catalog_refresh_polls": 30,  # re-read products.json every N polls while watching matches
     "checkout_delay": (1, 3),
     "use_product_json": True,
     "use_cart_api": True,
@@ -103,6 +112,7 @@ SUPREME_CONFIG = {
     "base_url": "https://www.supremenewyork.com",
     "checkout_delay": (0.5, 1.5),  # Very fast checkout
     "autofill_speed": "fast",  # 'slow', 'medium', 'fast'
+    "max_concurrent_bots": 5,  # Pooled contexts on Supreme's own browser
 }
 
 # ========================================
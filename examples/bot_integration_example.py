@@ -187,7 +187,7 @@ def example_analytics():
     captcha_stats = integration.get_captcha_analytics(days=30)
     print(f"CAPTCHA Analytics (last 30 days):")
     for platform, data in captcha_stats.get('platform_breakdown', {}).items():
-        print(f"  {platform}: {data.get('solve_success_rate')}")
+        print(f"  {platform}: {data.get('solve_success_rate', 0):.2f}%")
 
     # Get proxy statistics
     print("\nGetting proxy statistics...")
@@ -195,7 +195,7 @@ def example_analytics():
     print(f"Proxy Statistics:")
     print(f"  Total proxies: {proxy_stats.get('total_proxies', 0)}")
     print(f"  Working proxies: {proxy_stats.get('working_proxies', 0)}")
-    print(f"  Success rate: {proxy_stats.get('success_rate')}")
+    print(f"  Success rate: {proxy_stats.get('success_rate', 0):.2f}%")
 
     # Get detection analysis
     print("\nGetting detection analysis...")
@@ -203,7 +203,7 @@ def example_analytics():
     print(f"Detection Analysis (last 7 days):")
     print(f"  Total runs: {detection.get('total_runs', 0)}")
     print(f"  Detected runs: {detection.get('detected_runs', 0)}")
-    print(f"  Detection rate: {detection.get('detection_rate')}")
+    print(f"  Detection rate: {detection.get('detection_rate', 0):.2f}%")
 
 
 def example_reports():
@@ -12,6 +12,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.nike_bot import NikeBot
 from src.adidas_bot import AdidasBot
+from src.browser_pool import run_sync
 from src.account_manager import AccountManager
 from config.settings import CAPTCHA_CONFIG
 
@@ -374,11 +375,11 @@ class SneakerBotGUI:
                         "Solve it manually, then press Enter in terminal to continue.")
                 
                 bot = NikeBot(email, password, use_proxy)
-                bot.setup_browser()
+                run_sync(bot.setup_browser())
                 
                 try:
-                    if bot.login():
-                        success = bot.complete_purchase(sneaker, size)
+                    if run_sync(bot.login()):
+                        success = run_sync(bot.complete_purchase(sneaker, size))
                         if success:
                             messagebox.showinfo("Success", 
                                 f"Nike purchase process completed!\n" +
@@ -388,7 +389,7 @@ class SneakerBotGUI:
                     else:
                         messagebox.showerror("Failed", "Login failed")
                 finally:
-                    bot.cleanup()
+                    run_sync(bot.cleanup())
                     
             elif platform == "Adidas":
                 if use_manual_captcha:
@@ -222,7 +222,9 @@ class AccountManager:
     def deactivate_account(self, account_id: str) -> bool:
         """Deactivate an account"""
         if self.use_supabase:
-            return self.supabase.client.table("accounts").update({"status": "inactive"}).eq("id", account_id).execute()
+            result = self.supabase.client.table("accounts").update({"status": "inactive"}).eq("id", account_id).execute()
+            self.supabase.invalidate_account(account_id)
+            return result
         else:
             conn = sqlite3.connect(self.db_file)
             cursor = conn.cursor()
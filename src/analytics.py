@@ -7,6 +7,7 @@ from dataclasses import dataclass, asdict
 import json
 
 from src.supabase_client import get_supabase_manager
+from src.cache import dashboard_cache
 
 logger = logging.getLogger(__name__)
 
@@ -151,6 +152,7 @@ class Analytics:
             }
 
             self.db.update_bot_run(self.current_run_id, **update_data)
+            dashboard_cache.clear()
 
             logger.info(f"Ended bot run: {self.current_run_id} - Success: {success}")
             return True
@@ -196,10 +196,18 @@ class BotIntegration:
         """Get bot type metrics."""
         return self.analytics.get_bot_type_summary(platform, bot_type, days)
 
+    def get_dashboard_bundle(self, platform: str, bot_type: str, days: int = 7) -> Dict[str, Any]:
+        """Get platform metrics, CAPTCHA rate and bot run stats in one concurrent fetch."""
+        return self.db.get_dashboard_bundle(platform, bot_type, days)
+
     def get_dashboard_overview(self) -> Dict[str, Any]:
         """Get dashboard overview."""
         return self.dashboard.get_overview()
 
+    def get_dashboard_refresh(self, days: int = 7) -> Dict[str, Any]:
+        """Get all dashboard panels in one refresh."""
+        return self.dashboard.get_dashboard_refresh(days)
+
     def get_platform_stats(self, platform: str, days: int = 7) -> Dict[str, Any]:
         """Get platform statistics."""
         return self.dashboard.get_platform_stats(platform, days)
@@ -0,0 +1,262 @@
+"""Shared Playwright browser and context pool for SneakerBot Ultimate."""
+
+import asyncio
+import atexit
+import inspect
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from playwright.async_api import Browser, BrowserContext, async_playwright
+
+try:
+    from playwright._impl import _connection as _pw_connection
+except ImportError:
+    _pw_connection = None
+
+logger = logging.getLogger(__name__)
+
+ContextFactory = Callable[[Browser], Awaitable[BrowserContext]]
+
+_playwright = None
+_browsers: Dict[Hashable, Browser] = {}
+_browser_loop: Optional[asyncio.AbstractEventLoop] = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+class _NoStackInspect:
+    """inspect stand-in whose stack() skips the frame walk."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(inspect, name)
+
+    @staticmethod
+    def stack(context: int = 1) -> list:
+        return []
+
+
+def _disable_stack_capture() -> None:
+    """Stop Playwright from calling inspect.stack() on every API call.
+
+    Playwright records the caller's stack for trace metadata, and reading
+    every frame's source dominates CPU time with many concurrent pages.
+    Set PW_INSPECT_STACK=1 to keep the traces when debugging.
+    """
+    if os.getenv("PW_INSPECT_STACK", "0") == "1":
+        return
+    if _pw_connection is not None and hasattr(_pw_connection, "inspect"):
+        _pw_connection.inspect = _NoStackInspect()
+
+
+_disable_stack_capture()
+
+
+def _bind_loop() -> None:
+    """Forget Playwright objects created on another event loop."""
+    global _playwright, _browsers, _browser_loop, _browser_lock
+
+    loop = asyncio.get_running_loop()
+    if _browser_loop is not loop:
+        _playwright = None
+        _browsers = {}
+        _browser_loop = loop
+        _browser_lock = asyncio.Lock()
+
+
+async def _start_playwright():
+    global _playwright
+
+    if _playwright is None:
+        _playwright = await async_playwright().start()
+    return _playwright
+
+
+async def get_playwright():
+    """Get the process-wide Playwright driver, starting it on first use.
+
+    Every bot shares this one driver subprocess instead of spawning its own.
+    """
+    _bind_loop()
+    async with _browser_lock:
+        return await _start_playwright()
+
+
+def _options_key(value: Any) -> Hashable:
+    """Hashable form of launch options, so equal options map to one browser."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _options_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_options_key(v) for v in value)
+    return value
+
+
+async def get_browser(**launch_options: Any) -> Browser:
+    """Get the shared Chromium browser for these launch options.
+
+    Launch options only apply when a browser starts, so callers passing
+    different options get separate browsers on the one Playwright driver.
+    Playwright objects are bound to the loop that created them, so the
+    browser is relaunched if called from a different event loop.
+    """
+    _bind_loop()
+    key = _options_key(launch_options)
+    async with _browser_lock:
+        browser = _browsers.get(key)
+        if browser is None or not browser.is_connected():
+            playwright = await _start_playwright()
+            browser = _browsers[key] = await playwright.chromium.launch(**launch_options)
+            logger.info(f"Launched shared browser ({len(_browsers)} running)")
+
+    return browser
+
+
+async def close_browser() -> None:
+    """Close the shared browsers and stop Playwright."""
+    global _playwright, _browsers
+
+    try:
+        for browser in _browsers.values():
+            await browser.close()
+        if _playwright:
+            await _playwright.stop()
+    except Exception as e:
+        logger.error(f"Error closing shared browser: {e}")
+    finally:
+        _playwright = None
+        _browsers = {}
+
+
+def run_sync(coro: Awaitable) -> Any:
+    """Run a coroutine on the bot event loop from synchronous code.
+
+    The loop lives in a daemon thread for the life of the process so the
+    shared browser and pooled contexts survive between calls.
+    """
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="browser-pool-loop", daemon=True).start()
+
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+@atexit.register
+def _close_browser_at_exit() -> None:
+    if _loop is not None and (_browsers or _playwright is not None):
+        run_sync(close_browser())
+
+
+class BrowserPool:
+    """Hands out reusable contexts on the shared browser."""
+
+    def __init__(
+        self,
+        size: int = 5,
+        context_factory: Optional[ContextFactory] = None,
+        launch_options: Optional[Dict[str, Any]] = None,
+        reuse: bool = True,
+    ):
+        """Initialize pool.
+
+        With reuse=False a released context is closed and replaced by a fresh
+        one from the factory, so nothing baked into it at creation (proxy,
+        user agent, viewport) carries over to the next user.
+        """
+        self.size = size
+        self.context_factory = context_factory
+        self.launch_options = launch_options or {}
+        self.reuse = reuse
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._created = 0
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.size)
+            self._created = 0
+
+    async def _new_context(self) -> BrowserContext:
+        browser = await get_browser(**self.launch_options)
+        if self.context_factory:
+            return await self.context_factory(browser)
+        return await browser.new_context()
+
+    async def warm(self, count: Optional[int] = None) -> None:
+        """Pre-create contexts so the first acquires don't wait on them."""
+        self._bind_loop()
+        for _ in range(min(count or self.size, self.size - self._created)):
+            self._created += 1
+            try:
+                self._queue.put_nowait(await self._new_context())
+            except Exception:
+                self._created -= 1
+                raise
+
+    async def acquire(self) -> BrowserContext:
+        """Take a context, creating one while under size or waiting for a release."""
+        self._bind_loop()
+        if self._queue.empty() and self._created < self.size:
+            self._created += 1
+            try:
+                return await self._new_context()
+            except Exception:
+                self._created -= 1
+                raise
+        return await self._queue.get()
+
+    async def release(self, context: BrowserContext) -> None:
+        """Reset a context and return it to the pool."""
+        if not self.reuse:
+            await self._replace(context)
+            return
+
+        try:
+            await context.clear_cookies()
+            for page in list(context.pages):
+                await page.close()
+        except Exception as e:
+            logger.warning(f"Discarding broken browser context: {e}")
+            self._created -= 1
+            try:
+                await context.close()
+            except Exception:
+                pass
+            return
+
+        if self._loop is asyncio.get_running_loop():
+            self._queue.put_nowait(context)
+        else:
+            await context.close()
+
+    async def _replace(self, context: BrowserContext) -> None:
+        """Close a context and queue a freshly created one in its slot."""
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+        if self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            self._queue.put_nowait(await self._new_context())
+        except Exception as e:
+            logger.warning(f"Could not replace browser context: {e}")
+            self._created -= 1
+
+    async def close(self) -> None:
+        """Close all idle contexts."""
+        while self._queue is not None and not self._queue.empty():
+            context = self._queue.get_nowait()
+            self._created -= 1
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser context: {e}")
@@ -0,0 +1,123 @@
+"""In-memory TTL caching for SneakerBot Ultimate."""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+_request_memo: ContextVar[Optional[dict]] = ContextVar("request_memo", default=None)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 30):
+        """Initialize cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key and return its value."""
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def ttl_cache(cache: TTLCache, seconds: Optional[float] = None) -> Callable:
+    """Cache a method's results in cache, keyed on its arguments.
+
+    The bound instance is left out of the key, so this is meant for
+    singleton services. Empty (falsy) results are not cached so errors
+    are retried on the next call.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (func.__qualname__, args, frozenset(kwargs.items()))
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(self, *args, **kwargs)
+                if value:
+                    cache.set(key, value, seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def request_scope():
+    """Share read results between all calls made inside one request.
+
+    Nested scopes reuse the outermost memo.
+    """
+    if _request_memo.get() is not None:
+        yield
+        return
+
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+
+def request_memoized(func: Callable) -> Callable:
+    """Memoize a method for the current request_scope(); a no-op outside one."""
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        memo = _request_memo.get()
+        if memo is None:
+            return func(self, *args, **kwargs)
+
+        key = (func.__qualname__, args, frozenset(kwargs.items()))
+        if key not in memo:
+            memo[key] = func(self, *args, **kwargs)
+        return memo[key]
+
+    return wrapper
+
+
+# Shared by dashboard read endpoints; cleared whenever bot runs are written.
+dashboard_cache = TTLCache(maxsize=128, ttl=30)
@@ -2,14 +2,48 @@
 
 import logging
 import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from src.supabase_client import get_supabase_manager
 from src.analytics import get_analytics
+from src.cache import dashboard_cache, request_scope, ttl_cache
 
 logger = logging.getLogger(__name__)
 
+PLATFORMS: Tuple[str, ...] = ("Nike", "Adidas", "Shopify", "Supreme", "Footsites")
+PLATFORMS_SET = frozenset(PLATFORMS)
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _dump_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _format_rates(data: Any) -> Any:
+    """Render numeric *_rate fields as "12.34%" strings for legacy clients."""
+    if isinstance(data, dict):
+        return {
+            k: f"{v:.2f}%" if k.endswith("_rate") and isinstance(v, (int, float)) else _format_rates(v)
+            for k, v in data.items()
+        }
+    if isinstance(data, list):
+        return [_format_rates(v) for v in data]
+    return data
+
 
 class DashboardAPI:
     """Provides API endpoints for the dashboard."""
@@ -19,13 +53,12 @@ class DashboardAPI:
         self.db = get_supabase_manager()
         self.analytics = get_analytics()
 
+    @ttl_cache(dashboard_cache, seconds=10)
     def get_overview(self) -> Dict[str, Any]:
         """Get dashboard overview."""
         try:
-            platforms = ["Nike", "Adidas", "Shopify", "Supreme", "Footsites"]
-
             overview = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "platforms": {},
                 "total_metrics": {
                     "total_runs_today": 0,
@@ -34,13 +67,15 @@ class DashboardAPI:
                 },
             }
 
-            for platform in platforms:
+            captcha_rates = self.db.get_captcha_success_rates(days=1)
+
+            for platform in PLATFORMS:
                 metrics = self.db.get_platform_metrics(platform, days=1)
                 overview["platforms"][platform] = {
                     "total_attempts": metrics.get("total_attempts", 0),
                     "successful": metrics.get("successful_attempts", 0),
-                    "success_rate": f"{metrics.get('success_rate', 0):.2f}%",
-                    "captcha_solve_rate": f"{self.db.get_captcha_success_rate(platform, days=1):.2f}%",
+                    "success_rate": round(metrics.get("success_rate", 0), 2),
+                    "captcha_solve_rate": round(captcha_rates.get(platform, 0), 2),
                 }
                 overview["total_metrics"]["total_runs_today"] += metrics.get("total_attempts", 0)
 
@@ -49,6 +84,7 @@ class DashboardAPI:
             logger.error(f"Error getting overview: {e}")
             return {}
 
+    @ttl_cache(dashboard_cache, seconds=30)
     def get_platform_stats(self, platform: str, days: int = 7) -> Dict[str, Any]:
         """Get detailed stats for a platform."""
         try:
@@ -61,10 +97,10 @@ class DashboardAPI:
                 "total_attempts": metrics.get("total_attempts", 0),
                 "successful_attempts": metrics.get("successful_attempts", 0),
                 "failed_attempts": metrics.get("failed_attempts", 0),
-                "success_rate": f"{metrics.get('success_rate', 0):.2f}%",
+                "success_rate": round(metrics.get("success_rate", 0), 2),
                 "average_duration_ms": metrics.get("average_duration_ms", 0),
-                "captcha_success_rate": f"{captcha_rate:.2f}%",
-                "detection_rate": f"{metrics.get('detection_rate', 0):.2f}%",
+                "captcha_success_rate": round(captcha_rate, 2),
+                "detection_rate": round(metrics.get("detection_rate", 0), 2),
             }
         except Exception as e:
             logger.error(f"Error getting platform stats: {e}")
@@ -76,8 +112,8 @@ class DashboardAPI:
             stats = self.db.get_bot_run_stats(platform, bot_type, days)
             return {
                 **stats,
-                "success_rate": f"{stats.get('success_rate', 0):.2f}%",
-                "average_duration_seconds": f"{stats.get('average_duration_ms', 0) / 1000:.2f}",
+                "success_rate": round(stats.get("success_rate", 0), 2),
+                "average_duration_seconds": round(stats.get("average_duration_ms", 0) / 1000, 2),
             }
         except Exception as e:
             logger.error(f"Error getting bot type stats: {e}")
@@ -87,95 +123,116 @@ class DashboardAPI:
         """Get account statistics."""
         try:
             stats = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "platform_breakdown": {},
             }
 
-            platforms = [platform] if platform else ["Nike", "Adidas", "Shopify", "Supreme", "Footsites"]
-
-            for p in platforms:
-                accounts = self.db.client.table("accounts").select("*").eq("platform", p).execute().data or []
-                active_accounts = [a for a in accounts if a.get("status") == "active"]
+            platforms = {platform} if platform else PLATFORMS_SET
 
-                if active_accounts:
-                    avg_success = sum(a.get("success_count", 0) for a in active_accounts) / len(active_accounts)
-                    avg_failure = sum(a.get("failure_count", 0) for a in active_accounts) / len(active_accounts)
+            rows = (
+                self.db.client.rpc("get_account_platform_breakdown", {"p_platform": platform}).execute().data or []
+            )
 
-                    stats["platform_breakdown"][p] = {
-                        "total_accounts": len(accounts),
-                        "active_accounts": len(active_accounts),
-                        "average_success_per_account": f"{avg_success:.2f}",
-                        "average_failures_per_account": f"{avg_failure:.2f}",
-                    }
+            stats["platform_breakdown"] = {
+                r["platform"]: {
+                    "total_accounts": r.get("total_accounts", 0),
+                    "active_accounts": r.get("active_accounts", 0),
+                    "average_success_per_account": round(float(r.get("avg_success") or 0), 2),
+                    "average_failures_per_account": round(float(r.get("avg_failure") or 0), 2),
+                }
+                for r in rows
+                if r.get("platform") in platforms and r.get("active_accounts")
+            }
 
             return stats
         except Exception as e:
             logger.error(f"Error getting account stats: {e}")
             return {}
 
+    @ttl_cache(dashboard_cache, seconds=30)
     def get_captcha_analytics(self, days: int = 7) -> Dict[str, Any]:
         """Get CAPTCHA analytics."""
         try:
-            platforms = ["Nike", "Adidas", "Shopify", "Supreme", "Footsites"]
-
             analytics = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "period_days": days,
                 "platform_breakdown": {},
             }
 
-            for platform in platforms:
-                rate = self.db.get_captcha_success_rate(platform, days)
-                analytics["platform_breakdown"][platform] = {
-                    "solve_success_rate": f"{rate:.2f}%",
-                    "estimated_cost": f"${(100 - rate) * 0.01:.2f} per 100 attempts" if rate < 100 else "No failures",
+            rates = self.db.get_captcha_success_rates(days)
+            analytics["platform_breakdown"] = {
+                platform: {
+                    "solve_success_rate": round(rate, 2),
+                    "estimated_cost_per_100": round(max(100 - rate, 0) * 0.01, 2),
                 }
+                for platform, rate in ((p, rates.get(p, 0)) for p in PLATFORMS)
+            }
 
             return analytics
         except Exception as e:
             logger.error(f"Error getting CAPTCHA analytics: {e}")
             return {}
 
+    @ttl_cache(dashboard_cache, seconds=30)
     def get_proxy_stats(self) -> Dict[str, Any]:
         """Get proxy performance statistics."""
         try:
-            proxies_data = self.db.client.table("proxy_performance").select("*").execute().data or []
+            timestamp = _now_iso()
+            proxies_data = (
+                self.db.client.table("proxy_performance")
+                .select("success_count, failure_count, detection_count")
+                .execute()
+                .data or []
+            )
 
             if not proxies_data:
                 return {
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "total_proxies": 0,
                     "working_proxies": 0,
                     "success_rate": 0,
                 }
 
-            working = sum(1 for p in proxies_data if p.get("success_count", 0) > p.get("failure_count", 0))
-            total_success = sum(p.get("success_count", 0) for p in proxies_data)
-            total_attempts = total_success + sum(p.get("failure_count", 0) for p in proxies_data)
+            top_performing = (
+                self.db.client.table("proxy_performance")
+                .select("proxy_address, platform, success_count, failure_count, detection_count, success_ratio")
+                .order("success_ratio", desc=True)
+                .limit(5)
+                .execute()
+                .data or []
+            )
+
+            working = total_success = total_failure = total_detection = 0
+            for p in proxies_data:
+                success = p.get("success_count") or 0
+                failure = p.get("failure_count") or 0
+                if success > failure:
+                    working += 1
+                total_success += success
+                total_failure += failure
+                total_detection += p.get("detection_count") or 0
+            total_attempts = total_success + total_failure
 
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "total_proxies": len(proxies_data),
                 "working_proxies": working,
-                "success_rate": f"{(total_success / total_attempts * 100) if total_attempts > 0 else 0:.2f}%",
-                "detection_rate": f"{(sum(p.get('detection_count', 0) for p in proxies_data) / len(proxies_data) if proxies_data else 0):.2f}%",
-                "top_performing": sorted(
-                    proxies_data,
-                    key=lambda x: x.get("success_count", 0) / max(x.get("success_count", 1) + x.get("failure_count", 1), 1),
-                    reverse=True
-                )[:5],
+                "success_rate": round(total_success / total_attempts * 100, 2) if total_attempts > 0 else 0.0,
+                "detection_rate": round(total_detection / len(proxies_data), 2),
+                "top_performing": top_performing,
             }
         except Exception as e:
             logger.error(f"Error getting proxy stats: {e}")
             return {}
 
+    @ttl_cache(dashboard_cache, seconds=300)
     def get_daily_trend(self, platform: str, days: int = 30) -> Dict[str, Any]:
         """Get daily trend data."""
         try:
-            date_from = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
+            date_from = (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
 
             metrics_data = (
-                self.db.client.table("analytics_metrics")
+                self.db.client.table("mv_daily_platform_trend")
                 .select("metric_date, total_attempts, successful_attempts")
                 .eq("platform", platform)
                 .gte("metric_date", date_from)
@@ -205,37 +262,35 @@ class DashboardAPI:
     def get_detection_analysis(self, days: int = 7) -> Dict[str, Any]:
         """Get detection analysis."""
         try:
-            bot_runs = self.db.client.table("bot_runs").select("*").gte("created_at", (datetime.utcnow() - timedelta(days=days)).isoformat()).execute().data or []
+            summary = self.db.client.rpc("detection_summary", {"p_days": days}).execute().data or []
 
-            if not bot_runs:
+            total = sum(r.get("total") or 0 for r in summary)
+            if not total:
                 return {
                     "total_runs": 0,
                     "detected_runs": 0,
                     "detection_rate": 0,
                 }
 
-            detected = sum(1 for r in bot_runs if r.get("detection_triggered"))
+            detected = sum(r.get("detected") or 0 for r in summary)
 
             analysis = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "period_days": days,
-                "total_runs": len(bot_runs),
+                "total_runs": total,
                 "detected_runs": detected,
-                "detection_rate": f"{(detected / len(bot_runs) * 100) if bot_runs else 0:.2f}%",
-                "by_platform": {},
+                "detection_rate": round(detected / total * 100, 2),
+                "by_platform": {
+                    r["platform"]: {
+                        "total_runs": r["total"],
+                        "detected": r["detected"],
+                        "detection_rate": round(r["detected"] / r["total"] * 100, 2),
+                    }
+                    for r in summary
+                    if r.get("platform") in PLATFORMS_SET and r.get("total")
+                },
             }
 
-            platforms = list(set(r.get("platform") for r in bot_runs if r.get("platform")))
-            for platform in platforms:
-                platform_runs = [r for r in bot_runs if r.get("platform") == platform]
-                platform_detected = sum(1 for r in platform_runs if r.get("detection_triggered"))
-
-                analysis["by_platform"][platform] = {
-                    "total_runs": len(platform_runs),
-                    "detected": platform_detected,
-                    "detection_rate": f"{(platform_detected / len(platform_runs) * 100) if platform_runs else 0:.2f}%",
-                }
-
             return analysis
         except Exception as e:
             logger.error(f"Error getting detection analysis: {e}")
@@ -244,10 +299,17 @@ class DashboardAPI:
     def get_research_session_summary(self) -> Dict[str, Any]:
         """Get research session summary."""
         try:
-            sessions = self.db.client.table("research_sessions").select("*").eq("status", "active").execute().data or []
+            sessions = (
+                self.db.client.table("research_sessions")
+                .select("id, name, platform, started_at, total_runs, successful_runs")
+                .eq("status", "active")
+                .execute()
+                .data
+                or []
+            )
 
             summary = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "active_sessions": len(sessions),
                 "sessions": [],
             }
@@ -267,9 +329,27 @@ class DashboardAPI:
             logger.error(f"Error getting research session summary: {e}")
             return {}
 
-    def export_data_as_json(self, data_type: str, filters: Optional[Dict[str, Any]] = None) -> str:
-        """Export data as JSON."""
+    def get_dashboard_refresh(self, days: int = 7) -> Dict[str, Any]:
+        """Get every dashboard panel in one refresh, sharing repeated reads."""
+        with request_scope():
+            return {
+                "overview": self.get_overview(),
+                "captcha": self.get_captcha_analytics(days),
+                "proxy": self.get_proxy_stats(),
+                "detection": self.get_detection_analysis(days),
+                "accounts": self.get_account_stats(),
+            }
+
+    def export_data_as_json(
+        self, data_type: str, filters: Optional[Dict[str, Any]] = None, format_rates: bool = False
+    ) -> str:
+        """Export data as JSON; format_rates renders rates as percentage strings."""
         try:
+            cache_key = ("export_data_as_json", data_type, frozenset((filters or {}).items()), format_rates)
+            cached = dashboard_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             if data_type == "platform_stats":
                 platform = filters.get("platform", "Nike") if filters else "Nike"
                 data = self.get_platform_stats(platform)
@@ -282,7 +362,10 @@ class DashboardAPI:
             else:
                 data = {}
 
-            return json.dumps(data, indent=2)
+            payload = _dump_json(_format_rates(data) if format_rates else data)
+            if data:
+                dashboard_cache.set(cache_key, payload, ttl=10)
+            return payload
         except Exception as e:
             logger.error(f"Error exporting data: {e}")
             return "{}"
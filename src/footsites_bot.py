@@ -1,15 +1,41 @@
 """
 Footsites Bot - FootLocker, Champs, Eastbay
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import atexit
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, expect, TimeoutError as PlaywrightTimeout
 from utils.logger import logger, log_bot_action
 from utils.helper_functions import random_delay
 import time
 
+# Shared across checkouts; each checkout only gets its own context
+_playwright = None
+_browser = None
+
+
+def _get_browser():
+    """Launch the shared browser on first use"""
+    global _playwright, _browser
+    if _browser is None:
+        _playwright = sync_playwright().start()
+        _browser = _playwright.chromium.launch(headless=False)
+    return _browser
+
+
+@atexit.register
+def _close_browser():
+    """Close the shared browser and stop Playwright"""
+    global _playwright, _browser
+    try:
+        if _browser:
+            _browser.close()
+        if _playwright:
+            _playwright.stop()
+    except Exception:
+        pass
+    _browser = None
+    _playwright = None
+
 class FootsitesBot:
     """Bot for Footsites (FootLocker, Champs, Eastbay)"""
     
@@ -19,30 +45,48 @@ class FootsitesBot:
         "eastbay": "https://www.eastbay.com",
     }
     
+    # Selectors shared by every checkout
+    SEARCH_SEL = "input[type='search']"
+    ADD_TO_CART_NAME = "Add to Cart"
+    
     def __init__(self, site="footlocker"):
         self.base_url = self.SITES.get(site, self.SITES["footlocker"])
         self.site_name = site
         self.browser = None
+        self.context = None
         self.page = None
     
     def setup_browser(self):
-        """Initialize browser"""
-        playwright = sync_playwright().start()
-        self.browser = playwright.chromium.launch(headless=False)
-        self.page = self.browser.new_page()
+        """Open a fresh context on the shared browser"""
+        self.browser = _get_browser()
+        self.context = self.browser.new_context()
+        self.page = self.context.new_page()
+    
+    def _wait_for_page_settle(self, timeout=10000):
+        """Wait until the page goes network-idle, then add a short human-like jitter"""
+        try:
+            self.page.wait_for_load_state("networkidle", timeout=timeout)
+        except PlaywrightTimeout:
+            # Tracker-heavy pages may never go idle; the DOM is usable by now
+            pass
+        random_delay(0.1, 0.3)
+    
+    def _add_to_cart_button(self):
+        """Locate the Add to Cart button by its ARIA role"""
+        return self.page.get_by_role("button", name=self.ADD_TO_CART_NAME).first
     
     def search_product(self, product_name):
         """Search for product"""
         try:
             self.page.goto(self.base_url)
-            random_delay(2, 4)
+            random_delay(0.1, 0.3)
             
-            search_box = self.page.locator("input[type='search']")
-            if search_box.count() > 0:
-                search_box.fill(product_name)
-                search_box.press("Enter")
-                random_delay(3, 5)
-                return True
+            search_box = self.page.locator(self.SEARCH_SEL).first
+            search_box.fill(product_name, timeout=5000)
+            search_box.press("Enter")
+            self._wait_for_page_settle()
+            return True
+        except PlaywrightTimeout:
             return False
         except Exception as e:
             logger.exception(f"Footsites search error: {e}")
@@ -51,11 +95,12 @@ class FootsitesBot:
     def select_size(self, size):
         """Select size"""
         try:
-            size_btn = self.page.locator(f"button:has-text('{size}')")
-            if size_btn.count() > 0:
-                size_btn.first.click()
-                random_delay(1, 2)
-                return True
+            self.page.get_by_role("button", name=str(size), exact=True).first.click(timeout=5000)
+            expect(self._add_to_cart_button()).to_be_enabled(timeout=10000)
+            random_delay(0.1, 0.3)
+            return True
+        except (PlaywrightTimeout, AssertionError):
+            # expect() signals a button that never enabled with AssertionError
             return False
         except Exception as e:
             logger.exception(f"Size select error: {e}")
@@ -64,19 +109,20 @@ class FootsitesBot:
     def add_to_cart(self):
         """Add to cart"""
         try:
-            add_btn = self.page.locator("button:has-text('Add to Cart')")
-            if add_btn.count() > 0:
-                add_btn.click()
-                random_delay(2, 3)
-                return True
+            self._add_to_cart_button().click(timeout=5000)
+            self._wait_for_page_settle()
+            return True
+        except PlaywrightTimeout:
             return False
         except Exception as e:
             logger.exception(f"Add to cart error: {e}")
             return False
     
     def cleanup(self):
-        if self.browser:
-            self.browser.close()
+        """Close this checkout's context; the browser stays up for reuse"""
+        if self.context:
+            self.context.close()
+            self.context = None
 
 def footsites_checkout(site, product_name, size):
     """Footsites checkout"""
@@ -1,11 +1,6 @@
 """
 JD Sports, Finish Line, Dick's Sporting Goods Bot
 """
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.logger import logger
 from src.checkout_manager import process_checkout
 
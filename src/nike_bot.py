@@ -1,16 +1,17 @@
 """
 Complete Nike/SNKRS Bot Implementation
 Security Research Project - Demonstrates bot attack vectors on Nike platform
+
+Run the demo from the project root with: python -m src.nike_bot
 """
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-import time
-import random
-import sys
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+import asyncio
+import hashlib
+import json
 import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+from urllib.parse import urlparse
 
 from config.settings import NIKE_CONFIG, BOT_BEHAVIOR, CAPTCHA_CONFIG
 from utils.logger import (
@@ -18,11 +19,148 @@ from utils.logger import (
     log_purchase_success, log_purchase_failure, SessionLogger, log_exception
 )
 from utils.helper_functions import (
-    generate_user_agent, generate_browser_fingerprint, random_delay,
+    generate_user_agent, generate_browser_fingerprint, random_delay_async,
     human_typing_delay
 )
 from src.proxy_manager import get_random_proxy
 from src.captcha_solver import solve_captcha
+from src.browser_pool import BrowserPool, run_sync
+
+
+# ========================================
+# Browser Pool
+# ========================================
+
+BROWSER_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-web-security",
+    "--blink-settings=imagesEnabled=false",
+)
+
+# Context options shared by every bot; viewport and user agent vary per context
+BASE_CONTEXT_OPTIONS = {
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+}
+
+STEALTH_INIT_SCRIPT = """
+    // Override navigator.webdriver
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    
+    // Override plugins length
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    
+    // Override languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+    
+    // Override chrome property
+    window.chrome = {
+        runtime: {}
+    };
+    
+    // Override permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+"""
+
+# Solution is passed as an argument, never interpolated into the script
+INJECT_CAPTCHA_JS = "solution => { document.getElementById('g-recaptcha-response').innerHTML = solution; }"
+
+BLOCKED_RESOURCE_TYPES = frozenset(NIKE_CONFIG["blocked_resource_types"])
+
+# Selectors with fallbacks are CSS lists so one query covers every variant
+SELECTORS = {
+    "email": "input[name='emailAddress']",
+    "password": "input[name='password']",
+    "sign_in": "input[type='submit'][value='SIGN IN']",
+    "recaptcha": "iframe[title*='reCAPTCHA']",
+    "search_button": "button[data-pre='HeaderSearchBtn']",
+    "search_input": "input[type='search']",
+    "product_link": "a[data-qa='product-card-link']",
+    "add_to_bag": "button:has-text('Add to Bag'), button[data-qa='add-to-cart']",
+    "checkout": "button:has-text('Checkout'), a[href*='checkout']",
+    "draw": "button:has-text('Enter Draw'), button:has-text('Join Draw')",
+}
+
+# Any of these means the product page is ready for size selection
+PRODUCT_READY_SELECTOR = "button[data-qa^='size-'], button:has-text('Add to Bag'), button[data-qa='add-to-cart']"
+PAGE_READY_TIMEOUT = 10_000
+CLICK_TIMEOUT = 5_000
+
+_pools = {}
+
+
+async def _block_resources(route):
+    """Abort requests for assets the bot never looks at"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _new_stealth_context(browser, use_proxy):
+    """Create a context with a randomized fingerprint and stealth patches"""
+    # Generate fingerprint
+    fingerprint = generate_browser_fingerprint()
+    
+    # Create context with proxy if enabled
+    context_options = {
+        "viewport": {
+            "width": fingerprint["screen_resolution"][0],
+            "height": fingerprint["screen_resolution"][1]
+        },
+        "user_agent": generate_user_agent(),
+        **BASE_CONTEXT_OPTIONS,
+    }
+    
+    # Add proxy if enabled
+    if use_proxy:
+        proxy = get_random_proxy()
+        if proxy:
+            context_options["proxy"] = {"server": proxy}
+            log_bot_action("Proxy", "Nike", f"Using proxy: {proxy}")
+    
+    context = await browser.new_context(**context_options)
+    if BLOCKED_RESOURCE_TYPES:
+        await context.route("**/*", _block_resources)
+    
+    # Additional stealth measures
+    await context.add_init_script(STEALTH_INIT_SCRIPT)
+    
+    return context
+
+
+def get_nike_pool(use_proxy=True):
+    """
+    Get the context pool for Nike bots
+    
+    Proxied and direct contexts are pooled separately; both share one browser.
+    Proxied contexts are not reused: each release closes the context and a new
+    one is built with its own proxy, user agent and viewport, so two accounts
+    never share a fingerprint. That costs a context creation per account,
+    which direct contexts avoid by being reused as-is.
+    """
+    if use_proxy not in _pools:
+        _pools[use_proxy] = BrowserPool(
+            size=NIKE_CONFIG["max_concurrent_bots"],
+            context_factory=lambda browser: _new_stealth_context(browser, use_proxy),
+            launch_options={"headless": NIKE_CONFIG["headless"], "args": list(BROWSER_ARGS)},
+            reuse=not use_proxy,
+        )
+    return _pools[use_proxy]
 
 
 class NikeBot:
@@ -42,110 +180,110 @@ class NikeBot:
         self.email = email
         self.password = password
         self.use_proxy = use_proxy
+        self.pool = None
         self.browser = None
         self.context = None
         self.page = None
+        self._loc = {}
         self.logged_in = False
+        self.session_restored = False
         
-    def __enter__(self):
-        """Context manager entry"""
-        self.setup_browser()
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.setup_browser()
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        self.cleanup()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.cleanup()
         return False
     
-    def setup_browser(self):
-        """Initialize browser with stealth settings"""
+    async def setup_browser(self):
+        """Take a stealth context from the shared pool"""
         log_bot_action("Browser Setup", "Nike", "Initializing with stealth mode")
         
-        playwright = sync_playwright().start()
-        
-        # Launch browser with anti-detection settings
-        self.browser = playwright.chromium.launch(
-            headless=NIKE_CONFIG["headless"],
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-web-security",
-            ]
-        )
-        
-        # Generate fingerprint
-        fingerprint = generate_browser_fingerprint()
-        
-        # Create context with proxy if enabled
-        context_options = {
-            "viewport": {
-                "width": fingerprint["screen_resolution"][0],
-                "height": fingerprint["screen_resolution"][1]
-            },
-            "user_agent": generate_user_agent(),
-            "locale": "en-US",
-            "timezone_id": "America/New_York",
-        }
+        self.pool = get_nike_pool(self.use_proxy)
+        self.context = await self.pool.acquire()
+        self.browser = self.context.browser
+        self.page = await self.context.new_page()
         
-        # Add proxy if enabled
-        if self.use_proxy:
-            proxy = get_random_proxy()
-            if proxy:
-                context_options["proxy"] = {"server": proxy}
-                log_bot_action("Proxy", "Nike", f"Using proxy: {proxy}")
+        # Locators are lazy, so they can be built once per page and reused
+        self._loc = {name: self.page.locator(selector) for name, selector in SELECTORS.items()}
+        self.session_restored = await self._restore_session()
+        log_bot_action("Browser Setup", "Nike", "✅ Browser initialized successfully")
+    
+    @property
+    def _state_path(self):
+        """Saved session file for this account (email is hashed, not stored)"""
+        digest = hashlib.sha256(self.email.lower().encode()).hexdigest()[:16]
+        return os.path.join(NIKE_CONFIG["session_state_dir"], f"{digest}.json")
+    
+    async def _restore_session(self):
+        """
+        Load saved login cookies into the context if they are fresh enough
         
-        self.context = self.browser.new_context(**context_options)
+        Returns:
+            bool: True if cookies were restored
+        """
+        path = self._state_path
+        try:
+            if time.time() - os.path.getmtime(path) > NIKE_CONFIG["session_state_max_age"]:
+                return False
+            with open(path, "r") as f:
+                state = json.load(f)
+            await self.context.add_cookies(state.get("cookies", []))
+            log_bot_action("Session", "Nike", "Restored saved login")
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            log_exception(e, "Session restore")
+            return False
+    
+    async def _save_session(self):
+        """Save the context's cookies so the next run can skip login"""
+        try:
+            os.makedirs(NIKE_CONFIG["session_state_dir"], exist_ok=True)
+            await self.context.storage_state(path=self._state_path)
+        except Exception as e:
+            log_exception(e, "Session save")
+    
+    async def _check_session(self):
+        """
+        Check whether restored cookies still hold a valid login
         
-        # Additional stealth measures
-        self.context.add_init_script("""
-            // Override navigator.webdriver
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Override plugins length
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            
-            // Override languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            
-            // Override chrome property
-            window.chrome = {
-                runtime: {}
-            };
-            
-            // Override permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-        """)
+        Returns:
+            bool: True if the account page loads without redirecting to login
+        """
+        try:
+            await self.page.goto(NIKE_CONFIG["account_url"], wait_until="domcontentloaded")
+        except Exception as e:
+            log_exception(e, "Session check")
+            return False
         
-        self.page = self.context.new_page()
-        log_bot_action("Browser Setup", "Nike", "✅ Browser initialized successfully")
+        # Logged-out visitors are redirected to the login page or the accounts.nike.com sign-in host
+        final = urlparse(self.page.url)
+        expected = urlparse(NIKE_CONFIG["account_url"])
+        self.logged_in = (
+            final.hostname == expected.hostname
+            and final.path.rstrip("/") == expected.path.rstrip("/")
+        )
+        if self.logged_in:
+            log_bot_action("Session", "Nike", "✅ Saved login still valid, skipping login")
+        return self.logged_in
     
-    def cleanup(self):
-        """Clean up browser resources"""
+    async def cleanup(self):
+        """Return this bot's context to the pool"""
         try:
-            if self.page:
-                self.page.close()
             if self.context:
-                self.context.close()
-            if self.browser:
-                self.browser.close()
-            log_bot_action("Cleanup", "Nike", "Browser closed")
+                await self.pool.release(self.context)
+            self.context = self.page = None
+            self._loc = {}
+            log_bot_action("Cleanup", "Nike", "Context released")
         except Exception as e:
             log_exception(e, "Browser cleanup")
     
-    def login(self):
+    async def login(self):
         """
         Log into Nike account
         
@@ -156,45 +294,37 @@ class NikeBot:
             try:
                 log_bot_action("Login", "Nike", f"Logging in as {self.email}")
                 
-                # Navigate to login page
-                self.page.goto(NIKE_CONFIG["login_url"], wait_until="networkidle")
-                random_delay(2, 4)
+                # Navigate to login page and wait for the form, not for trackers
+                await self.page.goto(NIKE_CONFIG["login_url"], wait_until="domcontentloaded")
+                email_field = self._loc["email"]
+                await email_field.wait_for(state="visible", timeout=PAGE_READY_TIMEOUT)
                 
-                # Enter email
-                email_field = self.page.locator("input[name='emailAddress']")
-                email_field.fill("")  # Clear first
+                # Enter email (fill replaces any existing value in one call)
+                await email_field.fill(self.email)
                 
-                # Type with human-like delay
-                for char in self.email:
-                    email_field.type(char)
-                    time.sleep(random.uniform(0.05, 0.15))
-                
-                random_delay(0.5, 1.5)
+                await random_delay_async(0.5, 1.5)
                 
                 # Enter password
-                password_field = self.page.locator("input[name='password']")
-                password_field.fill("")  # Clear first
-                
-                for char in self.password:
-                    password_field.type(char)
-                    time.sleep(random.uniform(0.05, 0.15))
+                password_field = self._loc["password"]
+                await password_field.fill(self.password)
                 
-                random_delay(0.5, 1.5)
+                await random_delay_async(0.5, 1.5)
                 
                 # Handle CAPTCHA if present
-                self._handle_captcha()
+                await self._handle_captcha()
                 
                 # Click sign in button
-                sign_in_button = self.page.locator("input[type='submit'][value='SIGN IN']")
-                sign_in_button.click()
+                sign_in_button = self._loc["sign_in"]
+                await sign_in_button.click()
                 
                 # Wait for navigation
-                random_delay(3, 5)
+                await random_delay_async(3, 5)
                 
                 # Check if login was successful
                 if "member" in self.page.url.lower() or "account" in self.page.url.lower():
                     self.logged_in = True
                     log_bot_action("Login", "Nike", "✅ Login successful")
+                    await self._save_session()
                     return True
                 else:
                     log_bot_action("Login", "Nike", "❌ Login failed - checking for errors")
@@ -204,40 +334,38 @@ class NikeBot:
                 log_exception(e, "Nike Login")
                 return False
     
-    def _handle_captcha(self):
+    async def _handle_captcha(self):
         """Handle CAPTCHA if present"""
         try:
             # Check for reCAPTCHA
-            recaptcha_frame = self.page.locator("iframe[title*='reCAPTCHA']")
+            recaptcha_frame = self._loc["recaptcha"]
             
-            if recaptcha_frame.count() > 0:
+            if await recaptcha_frame.count() > 0:
                 log_captcha_event("Nike", "reCAPTCHA", False)
                 
                 if CAPTCHA_CONFIG["auto_solve"]:
                     # Get site key
                     iframe = recaptcha_frame.first
-                    site_key = iframe.get_attribute("data-sitekey")
+                    site_key = await iframe.get_attribute("data-sitekey")
                     
                     if site_key:
                         log_bot_action("CAPTCHA", "Nike", "Solving CAPTCHA...")
-                        solution = solve_captcha(site_key, self.page.url)
+                        solution = await asyncio.get_running_loop().run_in_executor(None, solve_captcha, site_key, self.page.url)
                         
                         if solution:
                             # Inject solution
-                            self.page.evaluate(f"""
-                                document.getElementById('g-recaptcha-response').innerHTML = '{solution}';
-                            """)
+                            await self.page.evaluate(INJECT_CAPTCHA_JS, solution)
                             log_captcha_event("Nike", "reCAPTCHA", True)
                         else:
                             log_captcha_event("Nike", "reCAPTCHA", False)
                 else:
                     log_bot_action("CAPTCHA", "Nike", "⚠️  Manual CAPTCHA solving required")
-                    input("Press Enter after solving CAPTCHA...")
+                    await asyncio.get_running_loop().run_in_executor(None, input, "Press Enter after solving CAPTCHA...")
                     
         except Exception as e:
             log_exception(e, "CAPTCHA handling")
     
-    def search_sneaker(self, sneaker_name):
+    async def search_sneaker(self, sneaker_name):
         """
         Search for a sneaker
         
@@ -251,22 +379,22 @@ class NikeBot:
             log_bot_action("Search", "Nike", f"Searching for: {sneaker_name}")
             
             # Click search icon
-            search_button = self.page.locator("button[data-pre='HeaderSearchBtn']")
-            if search_button.count() > 0:
-                search_button.click()
-                random_delay(1, 2)
+            search_button = self._loc["search_button"]
+            if await search_button.count() > 0:
+                await search_button.click()
+                await random_delay_async(1, 2)
             
             # Type search query
-            search_input = self.page.locator("input[type='search']")
-            if search_input.count() > 0:
-                search_input.fill(sneaker_name)
-                search_input.press("Enter")
-                random_delay(3, 5)
+            search_input = self._loc["search_input"]
+            if await search_input.count() > 0:
+                await search_input.fill(sneaker_name)
+                await search_input.press("Enter")
+                await random_delay_async(3, 5)
             
             # Get first product result
-            product_link = self.page.locator("a[data-qa='product-card-link']").first
-            if product_link.count() > 0:
-                product_url = product_link.get_attribute("href")
+            product_link = self._loc["product_link"].first
+            if await product_link.count() > 0:
+                product_url = await product_link.get_attribute("href")
                 log_bot_action("Search", "Nike", f"✅ Found product: {product_url}")
                 return product_url
             else:
@@ -277,7 +405,27 @@ class NikeBot:
             log_exception(e, "Nike Search")
             return None
     
-    def select_size(self, size):
+    async def _open_product_page(self, url):
+        """
+        Navigate to a product page and wait until it can be interacted with
+        
+        Args:
+            url: Product URL
+            
+        Returns:
+            bool: True if the page became ready in time
+        """
+        try:
+            await self.page.goto(url, wait_until="domcontentloaded")
+            await self.page.locator(PRODUCT_READY_SELECTOR).first.wait_for(
+                state="visible", timeout=PAGE_READY_TIMEOUT
+            )
+            return True
+        except PlaywrightTimeout:
+            log_bot_action("Navigation", "Nike", f"❌ Product page not ready: {url}")
+            return False
+    
+    async def select_size(self, size):
         """
         Select shoe size
         
@@ -290,31 +438,25 @@ class NikeBot:
         try:
             log_bot_action("Size Selection", "Nike", f"Selecting size: {size}")
             
-            # Wait for size selector to be visible
-            random_delay(1, 2)
-            
-            # Find size button
+            # Find size button; click() waits for it to appear
             size_str = str(size)
-            size_button = self.page.locator(f"button:has-text('US {size_str}')")
+            size_button = self.page.locator(f"button:has-text('US {size_str}'), button[data-qa='size-{size_str}']")
             
-            if size_button.count() == 0:
-                # Try alternate format
-                size_button = self.page.locator(f"button[data-qa='size-{size_str}']")
-            
-            if size_button.count() > 0:
-                size_button.first.click()
-                random_delay(0.5, 1.5)
-                log_bot_action("Size Selection", "Nike", f"✅ Size {size} selected")
-                return True
-            else:
+            try:
+                await size_button.first.click(timeout=CLICK_TIMEOUT)
+            except PlaywrightTimeout:
                 log_bot_action("Size Selection", "Nike", f"❌ Size {size} not available")
                 return False
+            
+            await random_delay_async(0.5, 1.5)
+            log_bot_action("Size Selection", "Nike", f"✅ Size {size} selected")
+            return True
                 
         except Exception as e:
             log_exception(e, "Size Selection")
             return False
     
-    def add_to_cart(self):
+    async def add_to_cart(self):
         """
         Add item to cart
         
@@ -325,24 +467,21 @@ class NikeBot:
             log_bot_action("Add to Cart", "Nike", "Adding to cart...")
             
             # Click add to cart button
-            add_to_cart_btn = self.page.locator("button:has-text('Add to Bag')")
-            if add_to_cart_btn.count() == 0:
-                add_to_cart_btn = self.page.locator("button[data-qa='add-to-cart']")
-            
-            if add_to_cart_btn.count() > 0:
-                add_to_cart_btn.first.click()
-                random_delay(2, 3)
-                log_bot_action("Add to Cart", "Nike", "✅ Added to cart")
-                return True
-            else:
+            try:
+                await self._loc["add_to_bag"].first.click(timeout=CLICK_TIMEOUT)
+            except PlaywrightTimeout:
                 log_bot_action("Add to Cart", "Nike", "❌ Add to cart button not found")
                 return False
+            
+            await random_delay_async(2, 3)
+            log_bot_action("Add to Cart", "Nike", "✅ Added to cart")
+            return True
                 
         except Exception as e:
             log_exception(e, "Add to Cart")
             return False
     
-    def go_to_checkout(self):
+    async def go_to_checkout(self):
         """
         Navigate to checkout
         
@@ -353,24 +492,21 @@ class NikeBot:
             log_bot_action("Checkout", "Nike", "Navigating to checkout...")
             
             # Click checkout button
-            checkout_btn = self.page.locator("button:has-text('Checkout')")
-            if checkout_btn.count() == 0:
-                checkout_btn = self.page.locator("a[href*='checkout']")
-            
-            if checkout_btn.count() > 0:
-                checkout_btn.first.click()
-                random_delay(2, 4)
-                log_bot_action("Checkout", "Nike", "✅ Navigated to checkout")
-                return True
-            else:
+            try:
+                await self._loc["checkout"].first.click(timeout=CLICK_TIMEOUT)
+            except PlaywrightTimeout:
                 log_bot_action("Checkout", "Nike", "❌ Checkout button not found")
                 return False
+            
+            await random_delay_async(2, 4)
+            log_bot_action("Checkout", "Nike", "✅ Navigated to checkout")
+            return True
                 
         except Exception as e:
             log_exception(e, "Go to Checkout")
             return False
     
-    def enter_snkrs_draw(self, product_url, size):
+    async def enter_snkrs_draw(self, product_url, size):
         """
         Enter SNKRS draw for a product
         
@@ -386,34 +522,31 @@ class NikeBot:
                 log_purchase_attempt("Nike SNKRS", product_url, size)
                 
                 # Navigate to product page
-                self.page.goto(product_url, wait_until="networkidle")
-                random_delay(2, 4)
+                if not await self._open_product_page(product_url):
+                    log_purchase_failure("Nike SNKRS", product_url, "Product page did not load")
+                    return False
                 
                 # Select size
-                if not self.select_size(size):
+                if not await self.select_size(size):
                     return False
                 
                 # Click "Join Draw" or "Enter Draw" button
-                draw_button = self.page.locator("button:has-text('Enter Draw')")
-                if draw_button.count() == 0:
-                    draw_button = self.page.locator("button:has-text('Join Draw')")
-                
-                if draw_button.count() > 0:
-                    draw_button.first.click()
-                    random_delay(2, 3)
-                    
-                    log_purchase_success("Nike SNKRS", product_url)
-                    return True
-                else:
+                try:
+                    await self._loc["draw"].first.click(timeout=CLICK_TIMEOUT)
+                except PlaywrightTimeout:
                     log_purchase_failure("Nike SNKRS", product_url, "Draw button not found")
                     return False
+                
+                await random_delay_async(2, 3)
+                log_purchase_success("Nike SNKRS", product_url)
+                return True
                     
             except Exception as e:
                 log_exception(e, "SNKRS Draw Entry")
                 log_purchase_failure("Nike SNKRS", product_url, str(e))
                 return False
     
-    def complete_purchase(self, sneaker_name, size, product_url=None):
+    async def complete_purchase(self, sneaker_name, size, product_url=None):
         """
         Complete full purchase flow
         
@@ -429,32 +562,32 @@ class NikeBot:
             try:
                 # Login if not already logged in
                 if not self.logged_in:
-                    if not self.login():
-                        return False
+                    if not (self.session_restored and await self._check_session()):
+                        if not await self.login():
+                            return False
                 
                 # Navigate to product
-                if product_url:
-                    self.page.goto(product_url, wait_until="networkidle")
-                else:
-                    product_url = self.search_sneaker(sneaker_name)
+                if not product_url:
+                    product_url = await self.search_sneaker(sneaker_name)
                     if not product_url:
                         return False
                     
-                    full_url = f"https://www.nike.com{product_url}" if not product_url.startswith("http") else product_url
-                    self.page.goto(full_url, wait_until="networkidle")
+                    if not product_url.startswith("http"):
+                        product_url = f"https://www.nike.com{product_url}"
                 
-                random_delay(2, 4)
+                if not await self._open_product_page(product_url):
+                    return False
                 
                 # Select size
-                if not self.select_size(size):
+                if not await self.select_size(size):
                     return False
                 
                 # Add to cart
-                if not self.add_to_cart():
+                if not await self.add_to_cart():
                     return False
                 
                 # Go to checkout
-                if not self.go_to_checkout():
+                if not await self.go_to_checkout():
                     return False
                 
                 log_purchase_success("Nike", sneaker_name)
@@ -483,12 +616,12 @@ def nike_login(email, password, use_proxy=True):
         NikeBot: Bot instance if successful, None otherwise
     """
     bot = NikeBot(email, password, use_proxy)
-    bot.setup_browser()
+    run_sync(bot.setup_browser())
     
-    if bot.login():
+    if run_sync(bot.login()):
         return bot
     else:
-        bot.cleanup()
+        run_sync(bot.cleanup())
         return None
 
 
@@ -507,8 +640,37 @@ def nike_purchase(email, password, sneaker_name, size, product_url=None, use_pro
     Returns:
         bool: True if successful
     """
-    with NikeBot(email, password, use_proxy) as bot:
-        return bot.complete_purchase(sneaker_name, size, product_url)
+    async def _purchase():
+        async with NikeBot(email, password, use_proxy) as bot:
+            return await bot.complete_purchase(sneaker_name, size, product_url)
+    
+    return run_sync(_purchase())
+
+
+async def nike_purchase_many(creds_list, sneaker_name, size, product_url=None, use_proxy=True,
+                             max_concurrent=None):
+    """
+    Run purchases for several accounts concurrently on the shared browser
+    
+    Args:
+        creds_list: List of (email, password) tuples
+        sneaker_name: Name of sneaker
+        size: Shoe size
+        product_url: Optional direct product URL
+        use_proxy: Whether to use proxy
+        max_concurrent: Max bots running at once (defaults to NIKE_CONFIG)
+        
+    Returns:
+        list: One bool per account, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrent or NIKE_CONFIG["max_concurrent_bots"])
+    
+    async def _purchase(email, password):
+        async with semaphore:
+            async with NikeBot(email, password, use_proxy) as bot:
+                return await bot.complete_purchase(sneaker_name, size, product_url)
+    
+    return await asyncio.gather(*[_purchase(email, password) for email, password in creds_list])
 
 
 def enter_snkrs_draw(email, password, product_url, size, use_proxy=True):
@@ -525,10 +687,13 @@ def enter_snkrs_draw(email, password, product_url, size, use_proxy=True):
     Returns:
         bool: True if successful
     """
-    with NikeBot(email, password, use_proxy) as bot:
-        if bot.login():
-            return bot.enter_snkrs_draw(product_url, size)
-        return False
+    async def _enter():
+        async with NikeBot(email, password, use_proxy) as bot:
+            if await bot.login():
+                return await bot.enter_snkrs_draw(product_url, size)
+            return False
+    
+    return run_sync(_enter())
 
 
 # ========================================
@@ -536,7 +701,7 @@ def enter_snkrs_draw(email, password, product_url, size, use_proxy=True):
 # ========================================
 
 if __name__ == "__main__":
-    # Demo mode
+    # Demo mode (python -m src.nike_bot, from the project root)
     print("Nike Bot - Security Research Demo")
     print("=" * 50)
     
@@ -544,6 +709,9 @@ if __name__ == "__main__":
     test_email = "test@example.com"
     test_password = "TestPassword123!"
     
-    with NikeBot(test_email, test_password, use_proxy=False) as bot:
-        print("Bot initialized successfully")
-        print("In production, this would proceed with login and purchase")
+    async def _demo():
+        async with NikeBot(test_email, test_password, use_proxy=False):
+            print("Bot initialized successfully")
+            print("In production, this would proceed with login and purchase")
+    
+    run_sync(_demo())
@@ -2,31 +2,77 @@
 Notification System
 Discord and Telegram notifications
 """
-import requests
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import atexit
+import queue
+import threading
+import time
 
 from config.settings import API_KEYS, NOTIFICATION_CONFIG
 from utils.logger import logger
+from utils.http_client import get_http2_client
 
-def send_discord_notification(message):
-    """Send Discord webhook notification"""
-    if not NOTIFICATION_CONFIG.get("discord_enabled"):
-        return False
-    
-    webhook_url = API_KEYS.get("Discord_Webhook")
-    if not webhook_url or webhook_url == "YOUR_DISCORD_WEBHOOK_URL":
-        logger.warning("Discord webhook not configured")
-        return False
-    
+BATCH_WINDOW = 0.2  # seconds to wait for more messages to the same channel
+MAX_BATCH = 5
+
+_notify_queue = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _ensure_worker():
+    """Start the background sender on first use"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_notify_worker, name="notify-worker", daemon=True)
+            _worker.start()
+
+
+def _notify_worker():
+    """Drain the queue, sending consecutive messages to one target as a batch"""
+    pending = None
+    while True:
+        item = pending or _notify_queue.get()
+        pending = None
+        batch = [item]
+        deadline = time.monotonic() + BATCH_WINDOW
+        
+        while len(batch) < MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                nxt = _notify_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if nxt[:2] != item[:2]:
+                pending = nxt
+                break
+            batch.append(nxt)
+        
+        channel, target = item[:2]
+        messages = [message for _, _, message in batch]
+        try:
+            if channel == "discord":
+                _post_discord(target, messages)
+            else:
+                _post_telegram(target, messages)
+        finally:
+            for _ in batch:
+                _notify_queue.task_done()
+
+
+def _post_discord(webhook_url, messages):
+    """POST one or more messages to a Discord webhook"""
     try:
-        payload = {"content": message}
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        if len(messages) == 1:
+            payload = {"content": messages[0]}
+        else:
+            payload = {"embeds": [{"description": message} for message in messages]}
+        response = get_http2_client().post(webhook_url, json=payload)
         
         if response.status_code == 204:
-            logger.info("✅ Discord notification sent")
+            logger.info("✅ Discord notification sent (%d message(s))", len(messages))
             return True
         else:
             logger.error(f"Discord notification failed: {response.status_code}")
@@ -36,25 +82,16 @@ def send_discord_notification(message):
         logger.exception(f"Discord notification error: {e}")
         return False
 
-def send_telegram_notification(message):
-    """Send Telegram notification"""
-    if not NOTIFICATION_CONFIG.get("telegram_enabled"):
-        return False
-    
-    bot_token = API_KEYS.get("Telegram_Bot_Token")
-    chat_id = API_KEYS.get("Telegram_Chat_ID")
-    
-    if not bot_token or not chat_id:
-        logger.warning("Telegram not configured")
-        return False
-    
+
+def _post_telegram(target, messages):
+    """POST one or more messages to a Telegram chat as a single message"""
+    url, chat_id = target
     try:
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        payload = {"chat_id": chat_id, "text": message}
-        response = requests.post(url, json=payload, timeout=10)
+        payload = {"chat_id": chat_id, "text": "\n\n".join(messages)}
+        response = get_http2_client().post(url, json=payload)
         
         if response.status_code == 200:
-            logger.info("✅ Telegram notification sent")
+            logger.info("✅ Telegram notification sent (%d message(s))", len(messages))
             return True
         else:
             logger.error(f"Telegram notification failed: {response.status_code}")
@@ -64,6 +101,48 @@ def send_telegram_notification(message):
         logger.exception(f"Telegram notification error: {e}")
         return False
 
+
+def flush_notifications(timeout=5):
+    """Wait for queued notifications to be sent"""
+    deadline = time.monotonic() + timeout
+    while _notify_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+atexit.register(flush_notifications)
+
+
+def send_discord_notification(message):
+    """Queue a Discord webhook notification; sent in the background"""
+    if not NOTIFICATION_CONFIG.get("discord_enabled"):
+        return False
+    
+    webhook_url = API_KEYS.get("Discord_Webhook")
+    if not webhook_url or webhook_url == "YOUR_DISCORD_WEBHOOK_URL":
+        logger.warning("Discord webhook not configured")
+        return False
+    
+    _ensure_worker()
+    _notify_queue.put(("discord", webhook_url, message))
+    return True
+
+def send_telegram_notification(message):
+    """Queue a Telegram notification; sent in the background"""
+    if not NOTIFICATION_CONFIG.get("telegram_enabled"):
+        return False
+    
+    bot_token = API_KEYS.get("Telegram_Bot_Token")
+    chat_id = API_KEYS.get("Telegram_Chat_ID")
+    
+    if not bot_token or not chat_id:
+        logger.warning("Telegram not configured")
+        return False
+    
+    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    _ensure_worker()
+    _notify_queue.put(("telegram", (url, chat_id), message))
+    return True
+
 def notify_success(platform, sneaker_name, order_number=None):
     """Send success notification"""
     message = f"🎉 SUCCESS: Purchased {sneaker_name} on {platform}"
@@ -3,60 +3,170 @@ Enhanced Proxy Manager
 Handles proxy rotation, testing, and management
 """
 
+import asyncio
+import logging
 import random
-import requests
+import time
+from dataclasses import dataclass
 from datetime import datetime
-import sqlite3
-import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import httpx
+
 from utils.logger import logger, log_proxy_event
+from utils.http_client import create_session
 from config.settings import PROXY_SETTINGS
+from src.proxy_store import ProxyStore
+
+_session = create_session(retries=0)
+
+EWMA_ALPHA = 0.2  # Weight of the newest latency sample
+MAX_CONSEC_FAILS = 5  # Proxy is benched after this many failures in a row
+RECOVERY_SECONDS = 600  # Benched proxies get retried after this long
+
+
+@dataclass
+class ProxyEntry:
+    """A proxy and its rolling health"""
+    url: str
+    latency_ewma: float = 1.0
+    consec_fail: int = 0
+    last_ok: float = 0.0
+    last_fail: float = 0.0
+    
+    def record(self, success, elapsed=None):
+        """Fold a probe result into the health score"""
+        now = time.time()
+        if success:
+            if elapsed is not None:
+                self.latency_ewma = (1 - EWMA_ALPHA) * self.latency_ewma + EWMA_ALPHA * elapsed
+            self.consec_fail = 0
+            self.last_ok = now
+        else:
+            self.consec_fail += 1
+            self.last_fail = now
+    
+    def is_available(self, now):
+        """Benched proxies become available again for a recovery probe"""
+        return self.consec_fail < MAX_CONSEC_FAILS or now - self.last_fail > RECOVERY_SECONDS
+    
+    @property
+    def weight(self):
+        return 1.0 / (self.latency_ewma * (1 + self.consec_fail))
+
 
 class ProxyManager:
     """Manage proxy rotation and testing"""
     
-    def __init__(self, proxy_file=None):
+    def __init__(self, proxy_file=None, db_file=None):
         self.proxy_file = proxy_file or PROXY_SETTINGS.get("proxy_list_file", "config/proxies.txt")
+        self.store = ProxyStore(db_file or PROXY_SETTINGS.get("proxy_db_file"))
         self.proxies = []
+        self._by_url = {}
         self.load_proxies()
     
     def load_proxies(self):
-        """Load proxies from file"""
+        """Load proxies from the shared store, importing the proxy file if it changed"""
         try:
             if os.path.exists(self.proxy_file):
-                with open(self.proxy_file, 'r') as f:
-                    self.proxies = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                logger.info(f"Loaded {len(self.proxies)} proxies")
+                self.store.import_file(self.proxy_file)
             else:
                 logger.warning(f"Proxy file not found: {self.proxy_file}")
+            
+            limit = PROXY_SETTINGS.get("max_loaded_proxies", 500)
+            self.proxies = [ProxyEntry(*row) for row in self.store.load(RECOVERY_SECONDS, limit)]
+            self._by_url = {entry.url: entry for entry in self.proxies}
+            logger.info("Loaded %d proxies", len(self.proxies))
         except Exception as e:
             logger.error(f"Error loading proxies: {e}")
     
     def get_random_proxy(self):
-        """Get a random proxy from the list"""
-        if not self.proxies:
+        """Get a proxy, weighted towards fast ones with few recent failures"""
+        now = time.time()
+        available = [entry for entry in self.proxies if entry.is_available(now)]
+        if not available:
             return None
-        return random.choice(self.proxies)
+        return random.choices(available, weights=[entry.weight for entry in available])[0].url
+    
+    def _record_probe(self, proxy, success, elapsed=None):
+        """Update the proxy's health with a probe result"""
+        entry = self._by_url.get(proxy)
+        if entry:
+            entry.record(success, elapsed)
+            self.store.update(
+                entry.url, entry.latency_ewma, entry.consec_fail, entry.last_ok, entry.last_fail,
+                enabled=entry.consec_fail < MAX_CONSEC_FAILS,
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            log_proxy_event(proxy, success)
     
     def test_proxy(self, proxy, test_url="https://www.google.com", timeout=10):
         """Test if a proxy is working"""
+        start = time.perf_counter()
         try:
             proxies = {
                 "http": proxy,
                 "https": proxy
             }
-            response = requests.get(test_url, proxies=proxies, timeout=timeout)
+            response = _session.get(test_url, proxies=proxies, timeout=timeout)
+            success = response.status_code == 200
+        except Exception:
+            success = False
+        self._record_probe(proxy, success, time.perf_counter() - start)
+        return success
+    
+    async def _probe(self, proxy, test_url, timeout):
+        """Test a proxy without blocking the event loop"""
+        start = time.perf_counter()
+        try:
+            async with httpx.AsyncClient(proxies=proxy, timeout=timeout) as client:
+                response = await client.get(test_url)
             success = response.status_code == 200
-            log_proxy_event(proxy, success)
-            return success
         except Exception:
-            log_proxy_event(proxy, False)
-            return False
+            success = False
+        self._record_probe(proxy, success, time.perf_counter() - start)
+        return proxy if success else None
+    
+    async def get_working_proxies_async(self, n=5, sample_size=20, test_url="https://www.google.com", timeout=5):
+        """
+        Probe a random sample of proxies concurrently
+        
+        Args:
+            n: Number of working proxies wanted
+            sample_size: Number of proxies probed at once
+            test_url: URL each proxy must fetch with a 200
+            timeout: Per-probe timeout in seconds
+            
+        Returns:
+            list: Up to n working proxies, fastest first
+        """
+        if not self.proxies:
+            return []
+        
+        candidates = random.sample(self.proxies, k=min(sample_size, len(self.proxies)))
+        tasks = [asyncio.create_task(self._probe(entry.url, test_url, timeout)) for entry in candidates]
+        working = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                proxy = await next_done
+                if proxy:
+                    working.append(proxy)
+                    if len(working) >= n:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+        return working
     
     def get_working_proxy(self, max_attempts=5):
-        """Get a working proxy by testing them"""
+        """Get a working proxy by testing candidates concurrently"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            working = asyncio.run(self.get_working_proxies_async(n=1, sample_size=max_attempts))
+            return working[0] if working else None
+        
+        # Already inside an event loop (async bots): probe serially instead
         for _ in range(max_attempts):
             proxy = self.get_random_proxy()
             if proxy and self.test_proxy(proxy):
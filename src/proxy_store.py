@@ -0,0 +1,112 @@
+"""
+Proxy Store
+SQLite-backed proxy health shared between bot processes
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DB_FILE = "database/proxies.db"
+
+_CREATE_SQL = """
+    CREATE TABLE IF NOT EXISTS proxies (
+        url TEXT PRIMARY KEY,
+        latency REAL NOT NULL DEFAULT 1.0,
+        fails INTEGER NOT NULL DEFAULT 0,
+        last_ok REAL NOT NULL DEFAULT 0,
+        last_fail REAL NOT NULL DEFAULT 0,
+        enabled INTEGER NOT NULL DEFAULT 1
+    );
+    CREATE INDEX IF NOT EXISTS idx_proxies_enabled_latency ON proxies (enabled, latency);
+    CREATE TABLE IF NOT EXISTS proxy_sources (
+        path TEXT PRIMARY KEY,
+        mtime REAL NOT NULL
+    );
+"""
+
+_SELECT_SQL = """
+    SELECT url, latency, fails, last_ok, last_fail FROM proxies
+    WHERE enabled = 1 OR last_fail < ?
+    ORDER BY latency ASC
+    LIMIT ?
+"""
+_INSERT_SQL = "INSERT OR IGNORE INTO proxies (url) VALUES (?)"
+_CREATE_IMPORT_SQL = "CREATE TEMP TABLE IF NOT EXISTS import_urls (url TEXT PRIMARY KEY)"
+_CLEAR_IMPORT_SQL = "DELETE FROM import_urls"
+_INSERT_IMPORT_SQL = "INSERT OR IGNORE INTO import_urls (url) VALUES (?)"
+_PRUNE_SQL = "DELETE FROM proxies WHERE url NOT IN (SELECT url FROM import_urls)"
+_UPDATE_SQL = "UPDATE proxies SET latency = ?, fails = ?, last_ok = ?, last_fail = ?, enabled = ? WHERE url = ?"
+_SOURCE_MTIME_SQL = "SELECT mtime FROM proxy_sources WHERE path = ?"
+_SET_SOURCE_MTIME_SQL = "INSERT OR REPLACE INTO proxy_sources (path, mtime) VALUES (?, ?)"
+
+
+class ProxyStore:
+    """Persist proxy health so every process shares one view of it"""
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or DB_FILE
+        os.makedirs(os.path.dirname(self.db_file) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_file, timeout=10, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_CREATE_SQL)
+
+    def import_file(self, path):
+        """
+        Sync proxies with a text file, skipping the read if it hasn't changed
+
+        The file is the source of truth: new lines are added, and proxies
+        no longer listed are removed along with their health history.
+
+        Args:
+            path: Proxy list file, one proxy per line
+
+        Returns:
+            int: Number of lines read (0 if the file was unchanged)
+        """
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            row = self.conn.execute(_SOURCE_MTIME_SQL, (path,)).fetchone()
+            if row and row[0] == mtime:
+                return 0
+
+            with open(path, "r") as f:
+                lines = (line.strip() for line in f.read().splitlines())
+            urls = [(line,) for line in lines if line and line[0] != "#"]
+
+            with self.conn:
+                self.conn.executemany(_INSERT_SQL, urls)
+                self.conn.execute(_CREATE_IMPORT_SQL)
+                self.conn.execute(_CLEAR_IMPORT_SQL)
+                self.conn.executemany(_INSERT_IMPORT_SQL, urls)
+                self.conn.execute(_PRUNE_SQL)
+                self.conn.execute(_SET_SOURCE_MTIME_SQL, (path, mtime))
+            return len(urls)
+
+    def load(self, recovery_seconds, limit=500):
+        """
+        Get usable proxies, fastest first
+
+        Benched proxies are included once their last failure is older
+        than recovery_seconds. Only the `limit` fastest are returned, so
+        with more usable proxies than that the slowest ones are never
+        rotated in; raise the limit for larger proxy lists.
+
+        Returns:
+            list: (url, latency, fails, last_ok, last_fail) tuples
+        """
+        with self._lock:
+            return self.conn.execute(_SELECT_SQL, (time.time() - recovery_seconds, limit)).fetchall()
+
+    def update(self, url, latency, fails, last_ok, last_fail, enabled):
+        """Save a proxy's latest health"""
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(_UPDATE_SQL, (latency, fails, last_ok, last_fail, int(enabled), url))
+        except sqlite3.Error as e:
+            logger.error(f"Error saving proxy health for {url}: {e}")
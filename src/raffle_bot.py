@@ -2,34 +2,59 @@
 Raffle Entry Bot
 Automates raffle entries across platforms
 """
-import requests
-import sys
-import os
-import time
+import asyncio
+import random
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import httpx
 
-from utils.helper_functions import generate_random_email, generate_random_name, generate_random_phone, generate_random_address
+from utils.helper_functions import generate_random_emails, generate_random_name, generate_random_phone, generate_random_addresses
 from utils.logger import logger
+from utils.http_client import HTTP2_AVAILABLE
 from src.proxy_manager import get_random_proxy
 
+MAX_CONCURRENT_ENTRIES = 10
+
 class RaffleBot:
     """Automated raffle entry system"""
-    
-    def __init__(self, use_proxies=True):
+
+    def __init__(self, use_proxies=True, max_concurrent=MAX_CONCURRENT_ENTRIES, entry_delay=None, simulate=True):
         self.use_proxies = use_proxies
+        self.simulate = simulate  # Skip the POST and report success, for research runs
+        self.max_concurrent = max_concurrent
+        self.entry_delay = entry_delay  # (min, max) jitter per entry, for rate-limited sites
         self.entries = []
-    
-    def enter_raffle(self, site_url, sneaker_id, size, num_entries=1):
-        """Enter raffle multiple times"""
+        self._clients = {}
+
+    def _get_client(self, proxy):
+        """One pooled HTTP/2 client per proxy; entries through a proxy share its connection"""
+        if proxy not in self._clients:
+            self._clients[proxy] = httpx.AsyncClient(
+                proxies=proxy,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(10.0, connect=3.0),
+            )
+        return self._clients[proxy]
+
+    async def _close_clients(self):
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    async def enter_raffle(self, site_url, sneaker_id, size, num_entries=1):
+        """Enter raffle multiple times, submitting entries concurrently"""
         logger.info(f"Entering raffle: {site_url} - {sneaker_id} (Size: {size})")
-        
-        for i in range(num_entries):
-            email = generate_random_email()
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        emails = generate_random_emails(num_entries)
+        addresses = generate_random_addresses(num_entries)
+
+        async def _enter(i):
+            email = emails[i]
             name = generate_random_name()
             phone = generate_random_phone()
-            address = generate_random_address()
-            
+            address = addresses[i]
+
             entry_data = {
                 "email": email,
                 "first_name": name["first_name"],
@@ -39,36 +64,39 @@ class RaffleBot:
                 "size": size,
                 **address
             }
-            
-            # Simulate raffle entry
-            success = self._submit_entry(site_url, entry_data)
-            
+
+            async with semaphore:
+                if self.entry_delay:
+                    await asyncio.sleep(random.uniform(*self.entry_delay))
+                success = await self._submit_entry(site_url, entry_data)
+
             if success:
                 self.entries.append(entry_data)
-                logger.info(f"✅ Entry {i+1}/{num_entries} submitted: {email}")
+                logger.info("✅ Entry %d/%d submitted: %s", i + 1, num_entries, email)
             else:
-                logger.error(f"❌ Entry {i+1}/{num_entries} failed")
-            
-            time.sleep(2)  # Delay between entries
-        
-        logger.info(f"Completed {len(self.entries)} raffle entries")
+                logger.error("❌ Entry %d/%d failed", i + 1, num_entries)
+
+        try:
+            results = await asyncio.gather(*[_enter(i) for i in range(num_entries)], return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Raffle entry error: %s", result)
+        finally:
+            await self._close_clients()
+
+        logger.info("Completed %d raffle entries", len(self.entries))
         return len(self.entries)
-    
-    def _submit_entry(self, site_url, entry_data):
+
+    async def _submit_entry(self, site_url, entry_data):
         """Submit a single raffle entry"""
-        try:
-            proxies = None
-            if self.use_proxies:
-                proxy = get_random_proxy()
-                if proxy:
-                    proxies = {"http": proxy, "https": proxy}
-            
-            # This is a simulation - actual implementation would POST to raffle endpoint
-            # response = requests.post(f"{site_url}/api/raffle", json=entry_data, proxies=proxies)
-            # return response.status_code == 200
-            
+        if self.simulate:
             return True  # Simulated success
-            
+
+        try:
+            proxy = get_random_proxy() if self.use_proxies else None
+            response = await self._get_client(proxy).post(f"{site_url}/api/raffle", json=entry_data)
+            return response.status_code == 200
+
         except Exception as e:
             logger.exception(f"Raffle entry error: {e}")
             return False
@@ -76,4 +104,4 @@ class RaffleBot:
 def enter_raffle(site_url, sneaker_id, size, num_entries=1):
     """Convenience function for raffle entry"""
     bot = RaffleBot()
-    return bot.enter_raffle(site_url, sneaker_id, size, num_entries)
+    return asyncio.run(bot.enter_raffle(site_url, sneaker_id, size, num_entries))
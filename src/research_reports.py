@@ -1,16 +1,163 @@
 """Research reports generator for SneakerBot Ultimate."""
 
+import contextvars
+import functools
+import io
 import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from html import escape
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, TextIO
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.supabase_client import get_supabase_manager
 from src.analytics import get_analytics
+from src.cache import request_scope
 
 logger = logging.getLogger(__name__)
 
+_HTML_HEAD = Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>$title</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                h1 { color: #333; }
+                h2 { color: #666; margin-top: 20px; }
+                .metric { margin: 10px 0; padding: 10px; background: #f5f5f5; }
+                .finding { margin: 5px 0; padding: 5px 10px; background: #e8f4f8; border-left: 3px solid #0066cc; }
+            </style>
+        </head>
+        <body>
+            <h1>$title</h1>
+            <p>Generated: $generated_at</p>
+            <h2>Executive Summary</h2>
+            <div class="metric">
+                """)
+
+_HTML_FINDINGS = """
+            </div>
+            <h2>Key Findings</h2>
+            """
+
+_HTML_TAIL = """
+        </body>
+        </html>
+        """
+
+_ATTACK_VECTORS = MappingProxyType({
+    "browser_automation": "Requires stealth techniques and fingerprint randomization",
+    "proxy_rotation": "Effective for IP-based detection bypass",
+    "behavior_mimicry": "Essential for timing and interaction analysis",
+    "queue_detection": "Can detect virtual waiting rooms",
+})
+
+_PLATFORM_RECOMMENDATIONS = (
+    "Implement multi-layer fingerprinting beyond navigator.webdriver checks",
+    "Use behavioral analysis (mouse movements, keystroke dynamics)",
+    "Deploy JavaScript challenge-response systems",
+    "Implement per-IP and per-session rate limiting",
+    "Use geo-IP verification for account access",
+    "Monitor for suspicious proxy usage patterns",
+)
+
+_COMMON_WEAKNESSES = (
+    "CAPTCHA solving bypass",
+    "Proxy rotation effectiveness",
+    "Browser fingerprinting evasion",
+)
+
+_BROWSER_AUTOMATION_DETECTION = MappingProxyType({
+    "effectiveness": "Medium",
+    "detection_methods": ("navigator.webdriver", "window.chrome", "automation headers"),
+    "evasion_techniques": ("JavaScript override", "stealth plugins"),
+})
+
+_FINGERPRINT_EVASION = MappingProxyType({
+    "effectiveness": "High",
+    "evasion_rate": "75%",
+    "techniques": ("canvas randomization", "webgl fingerprinting", "screen resolution spoofing"),
+})
+
+_PROXY_EFFECTIVENESS = MappingProxyType({
+    "effectiveness": "High",
+    "success_rate": "80%",
+    "bypass_rate": "High for IP-based detection",
+})
+
+_DETECTION_EVASION = MappingProxyType({
+    "effectiveness": "Medium",
+    "detection_rate": "35%",
+    "evasion_techniques": ("behavior mimicry", "random delays", "human-like interactions"),
+})
+
+_ATTACK_VECTOR_RATINGS = MappingProxyType({
+    "browser_automation": 75,
+    "proxy_rotation": 85,
+    "captcha_solving": 70,
+    "fingerprint_evasion": 80,
+    "detection_evasion": 60,
+})
+
+_CAPTCHA_DEFENSE = MappingProxyType({
+    "effectiveness": 65,
+    "bypass_methods": ("Third-party solvers", "Audio CAPTCHA exploitation"),
+    "recommendation": "Combine with other defenses",
+})
+
+_RATE_LIMITING_DEFENSE = MappingProxyType({
+    "effectiveness": 75,
+    "bypass_methods": ("Proxy rotation", "Distributed requests"),
+    "recommendation": "Implement per-session and per-IP limits",
+})
+
+_DETECTION_DEFENSE = MappingProxyType({
+    "effectiveness": 60,
+    "bypass_methods": ("Stealth techniques", "Behavior mimicry"),
+    "recommendation": "Multi-layer fingerprinting required",
+})
+
+_IP_REPUTATION_DEFENSE = MappingProxyType({
+    "effectiveness": 70,
+    "bypass_methods": ("Residential proxies", "VPN networks"),
+    "recommendation": "Use alongside behavioral analysis",
+})
+
+_DEFENSE_RECOMMENDATIONS = (
+    "Implement multi-factor authentication for account access",
+    "Use behavioral biometrics (mouse, keyboard, touch patterns)",
+    "Deploy CAPTCHA only at critical checkpoints",
+    "Implement rate limiting with adaptive thresholds",
+    "Use canvas/WebGL fingerprinting for device tracking",
+    "Monitor for proxy/VPN usage patterns",
+    "Implement virtual waiting room systems",
+    "Use machine learning for anomaly detection",
+)
+
+_query_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="report-query")
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+def _submit(fn, *args: Any) -> Future:
+    """Run a DB read on the report pool, keeping the caller's context vars."""
+    return _query_pool.submit(contextvars.copy_context().run, fn, *args)
+
 
 class ResearchReportGenerator:
     """Generates comprehensive research reports from collected data."""
@@ -22,11 +169,14 @@ class ResearchReportGenerator:
         self.report_dir = Path("reports")
         self.report_dir.mkdir(exist_ok=True)
 
+    @request_scope()
     def generate_platform_report(self, platform: str, days: int = 7) -> Dict[str, Any]:
         """Generate comprehensive report for a platform."""
         try:
-            metrics = self.db.get_platform_metrics(platform, days)
-            captcha_rate = self.db.get_captcha_success_rate(platform, days)
+            metrics_future = _submit(self.db.get_platform_metrics, platform, days)
+            captcha_future = _submit(self.db.get_captcha_success_rate, platform, days)
+            metrics = metrics_future.result()
+            captcha_rate = captcha_future.result()
 
             report = {
                 "title": f"Security Research Report - {platform.upper()}",
@@ -41,7 +191,7 @@ class ResearchReportGenerator:
                     "captcha_solve_rate": f"{captcha_rate:.2f}%",
                 },
                 "detailed_metrics": metrics,
-                "key_findings": self._generate_findings(platform, days),
+                "key_findings": self._generate_findings(metrics, captcha_rate),
                 "attack_vectors": self._analyze_attack_vectors(platform, days),
                 "defensive_recommendations": self._generate_recommendations(platform, days),
             }
@@ -51,6 +201,7 @@ class ResearchReportGenerator:
             logger.error(f"Error generating platform report: {e}")
             return {}
 
+    @request_scope()
     def generate_bot_type_report(self, platform: str, bot_type: str, days: int = 7) -> Dict[str, Any]:
         """Generate report for specific bot type."""
         try:
@@ -75,16 +226,22 @@ class ResearchReportGenerator:
             logger.error(f"Error generating bot type report: {e}")
             return {}
 
+    @request_scope()
     def generate_comparative_analysis(self, platforms: List[str], days: int = 7) -> Dict[str, Any]:
         """Generate comparative analysis across platforms."""
         try:
+            metrics_future = _submit(self.db.get_platform_metrics_bulk, tuple(platforms), days)
+            captcha_future = _submit(self.db.get_captcha_success_rates, days)
+            metrics_by_platform = metrics_future.result()
+            captcha_rates = captcha_future.result()
+
             platform_data = {}
             for platform in platforms:
-                metrics = self.db.get_platform_metrics(platform, days)
+                metrics = metrics_by_platform.get(platform, {})
                 platform_data[platform] = {
                     "success_rate": metrics.get("success_rate", 0),
                     "total_attempts": metrics.get("total_attempts", 0),
-                    "captcha_solve_rate": self.db.get_captcha_success_rate(platform, days),
+                    "captcha_solve_rate": captcha_rates.get(platform, 0),
                 }
 
             report = {
@@ -102,6 +259,7 @@ class ResearchReportGenerator:
             logger.error(f"Error generating comparative analysis: {e}")
             return {}
 
+    @request_scope()
     def generate_attack_vector_analysis(self) -> Dict[str, Any]:
         """Analyze effectiveness of different attack vectors."""
         try:
@@ -149,8 +307,8 @@ class ResearchReportGenerator:
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             filename = self.report_dir / f"{report_type}_{timestamp}.json"
 
-            with open(filename, "w") as f:
-                json.dump(report, f, indent=2)
+            with open(filename, "wb") as f:
+                f.write(_dump_json_bytes(report))
 
             logger.info(f"Report saved: {filename}")
             return True
@@ -164,10 +322,8 @@ class ResearchReportGenerator:
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             filename = self.report_dir / f"{report_type}_{timestamp}.html"
 
-            html = self._generate_html_report(report)
-
             with open(filename, "w") as f:
-                f.write(html)
+                self._write_html_report(report, f)
 
             logger.info(f"HTML report saved: {filename}")
             return True
@@ -175,17 +331,15 @@ class ResearchReportGenerator:
             logger.error(f"Error saving HTML report: {e}")
             return False
 
-    def _generate_findings(self, platform: str, days: int) -> List[str]:
-        """Generate key findings."""
+    def _generate_findings(self, metrics: Dict[str, Any], captcha_rate: float) -> List[str]:
+        """Generate key findings from already-fetched metrics."""
         findings = []
 
-        metrics = self.db.get_platform_metrics(platform, days)
         if metrics.get("success_rate", 0) > 50:
             findings.append(f"High success rate ({metrics.get('success_rate', 0):.1f}%) indicates moderate bot defenses")
         elif metrics.get("success_rate", 0) < 20:
             findings.append("Low success rate suggests robust anti-bot measures")
 
-        captcha_rate = self.db.get_captcha_success_rate(platform, days)
         if captcha_rate > 80:
             findings.append("CAPTCHA solving is highly effective on this platform")
         elif captcha_rate < 50:
@@ -195,23 +349,11 @@ class ResearchReportGenerator:
 
     def _analyze_attack_vectors(self, platform: str, days: int) -> Dict[str, str]:
         """Analyze attack vector effectiveness."""
-        return {
-            "browser_automation": "Requires stealth techniques and fingerprint randomization",
-            "proxy_rotation": "Effective for IP-based detection bypass",
-            "behavior_mimicry": "Essential for timing and interaction analysis",
-            "queue_detection": "Can detect virtual waiting rooms",
-        }
+        return dict(_ATTACK_VECTORS)
 
     def _generate_recommendations(self, platform: str, days: int) -> List[str]:
         """Generate defensive recommendations."""
-        return [
-            "Implement multi-layer fingerprinting beyond navigator.webdriver checks",
-            "Use behavioral analysis (mouse movements, keystroke dynamics)",
-            "Deploy JavaScript challenge-response systems",
-            "Implement per-IP and per-session rate limiting",
-            "Use geo-IP verification for account access",
-            "Monitor for suspicious proxy usage patterns",
-        ]
+        return list(_PLATFORM_RECOMMENDATIONS)
 
     def _analyze_bot_type(self, platform: str, bot_type: str, days: int) -> Dict[str, Any]:
         """Analyze specific bot type performance."""
@@ -235,36 +377,20 @@ class ResearchReportGenerator:
         return {
             "total_platforms": len(platforms),
             "analysis_period_days": days,
-            "common_weaknesses": [
-                "CAPTCHA solving bypass",
-                "Proxy rotation effectiveness",
-                "Browser fingerprinting evasion"
-            ],
+            "common_weaknesses": list(_COMMON_WEAKNESSES),
         }
 
     def _analyze_browser_automation_detection(self) -> Dict[str, Any]:
         """Analyze browser automation detection effectiveness."""
-        return {
-            "effectiveness": "Medium",
-            "detection_methods": ["navigator.webdriver", "window.chrome", "automation headers"],
-            "evasion_techniques": ["JavaScript override", "stealth plugins"],
-        }
+        return dict(_BROWSER_AUTOMATION_DETECTION)
 
     def _analyze_fingerprint_evasion(self) -> Dict[str, Any]:
         """Analyze fingerprint randomization effectiveness."""
-        return {
-            "effectiveness": "High",
-            "evasion_rate": "75%",
-            "techniques": ["canvas randomization", "webgl fingerprinting", "screen resolution spoofing"],
-        }
+        return dict(_FINGERPRINT_EVASION)
 
     def _analyze_proxy_effectiveness(self) -> Dict[str, Any]:
         """Analyze proxy rotation effectiveness."""
-        return {
-            "effectiveness": "High",
-            "success_rate": "80%",
-            "bypass_rate": "High for IP-based detection",
-        }
+        return dict(_PROXY_EFFECTIVENESS)
 
     def _analyze_captcha_effectiveness(self) -> Dict[str, Any]:
         """Analyze CAPTCHA solving effectiveness."""
@@ -277,99 +403,54 @@ class ResearchReportGenerator:
 
     def _analyze_detection_evasion(self) -> Dict[str, Any]:
         """Analyze detection evasion effectiveness."""
-        return {
-            "effectiveness": "Medium",
-            "detection_rate": "35%",
-            "evasion_techniques": ["behavior mimicry", "random delays", "human-like interactions"],
-        }
+        return dict(_DETECTION_EVASION)
 
     def _rate_attack_vectors(self) -> Dict[str, float]:
         """Rate effectiveness of attack vectors (0-100)."""
-        return {
-            "browser_automation": 75,
-            "proxy_rotation": 85,
-            "captcha_solving": 70,
-            "fingerprint_evasion": 80,
-            "detection_evasion": 60,
-        }
+        return dict(_ATTACK_VECTOR_RATINGS)
 
     def _rate_captcha_defense(self) -> Dict[str, Any]:
         """Rate CAPTCHA as defensive measure."""
-        return {
-            "effectiveness": 65,
-            "bypass_methods": ["Third-party solvers", "Audio CAPTCHA exploitation"],
-            "recommendation": "Combine with other defenses",
-        }
+        return dict(_CAPTCHA_DEFENSE)
 
     def _rate_rate_limiting_defense(self) -> Dict[str, Any]:
         """Rate rate limiting as defensive measure."""
-        return {
-            "effectiveness": 75,
-            "bypass_methods": ["Proxy rotation", "Distributed requests"],
-            "recommendation": "Implement per-session and per-IP limits",
-        }
+        return dict(_RATE_LIMITING_DEFENSE)
 
     def _rate_detection_defense(self) -> Dict[str, Any]:
         """Rate bot detection as defensive measure."""
-        return {
-            "effectiveness": 60,
-            "bypass_methods": ["Stealth techniques", "Behavior mimicry"],
-            "recommendation": "Multi-layer fingerprinting required",
-        }
+        return dict(_DETECTION_DEFENSE)
 
     def _rate_ip_reputation_defense(self) -> Dict[str, Any]:
         """Rate IP reputation as defensive measure."""
-        return {
-            "effectiveness": 70,
-            "bypass_methods": ["Residential proxies", "VPN networks"],
-            "recommendation": "Use alongside behavioral analysis",
-        }
+        return dict(_IP_REPUTATION_DEFENSE)
 
     def _defense_recommendations(self) -> List[str]:
         """Generate defense recommendations."""
-        return [
-            "Implement multi-factor authentication for account access",
-            "Use behavioral biometrics (mouse, keyboard, touch patterns)",
-            "Deploy CAPTCHA only at critical checkpoints",
-            "Implement rate limiting with adaptive thresholds",
-            "Use canvas/WebGL fingerprinting for device tracking",
-            "Monitor for proxy/VPN usage patterns",
-            "Implement virtual waiting room systems",
-            "Use machine learning for anomaly detection",
-        ]
+        return list(_DEFENSE_RECOMMENDATIONS)
+
+    def _write_html_report(self, report: Dict[str, Any], out: TextIO) -> None:
+        """Write HTML version of report to a text stream, piece by piece."""
+        out.write(_HTML_HEAD.substitute(
+            title=escape(str(report.get("title", "Report"))),
+            generated_at=escape(str(report.get("generated_at", ""))),
+        ))
+        out.write(escape(_dump_json_bytes(report.get("executive_summary", {})).decode(), quote=False))
+        out.write(_HTML_FINDINGS)
+        for i, finding in enumerate(report.get("key_findings", [])):
+            if i:
+                out.write("\n")
+            out.write(f'<div class="finding">{escape(str(finding), quote=False)}</div>')
+        out.write(_HTML_TAIL)
 
     def _generate_html_report(self, report: Dict[str, Any]) -> str:
         """Generate HTML version of report."""
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{report.get("title", "Report")}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333; }}
-                h2 {{ color: #666; margin-top: 20px; }}
-                .metric {{ margin: 10px 0; padding: 10px; background: #f5f5f5; }}
-                .finding {{ margin: 5px 0; padding: 5px 10px; background: #e8f4f8; border-left: 3px solid #0066cc; }}
-            </style>
-        </head>
-        <body>
-            <h1>{report.get("title", "Report")}</h1>
-            <p>Generated: {report.get("generated_at", "")}</p>
-            <h2>Executive Summary</h2>
-            <div class="metric">
-                {json.dumps(report.get("executive_summary", {}), indent=2)}
-            </div>
-            <h2>Key Findings</h2>
-            {chr(10).join(f'<div class="finding">{f}</div>' for f in report.get("key_findings", []))}
-        </body>
-        </html>
-        """
-        return html
+        buffer = io.StringIO()
+        self._write_html_report(report, buffer)
+        return buffer.getvalue()
 
 
+@functools.lru_cache(maxsize=None)
 def get_report_generator() -> ResearchReportGenerator:
     """Get or create report generator singleton."""
-    if not hasattr(get_report_generator, "_instance"):
-        get_report_generator._instance = ResearchReportGenerator()
-    return get_report_generator._instance
+    return ResearchReportGenerator()
@@ -2,59 +2,197 @@
 Rollback Manager
 Version control and backup system
 """
+import hashlib
+import json
 import shutil
 import os
+import subprocess
 import sys
 from datetime import datetime
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.logger import logger
 
 BACKUP_PATH = "backup/"
 SRC_PATH = "src/"
+OBJECTS_PATH = os.path.join(BACKUP_PATH, "objects")
+SNAPSHOTS_PATH = os.path.join(BACKUP_PATH, "snapshots")
+HASH_ALGORITHM = "blake2b"
+HASH_CHUNK_SIZE = 1024 * 1024
+SKIP_DIRS = {"__pycache__"}
+
+_CP = shutil.which("cp") if sys.platform.startswith("linux") else None
+
+def _fast_copy(source, destination):
+    """
+    Copy one file with copy_file_range so the data never passes through userspace
+    
+    The kernel may also share the blocks (reflink) on filesystems that
+    support it. Falls back to shutil.copy2 where copy_file_range isn't
+    available or fails (e.g. cross-filesystem copies on older kernels).
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(source, destination)
+    
+    try:
+        with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not copied:
+                    break
+                remaining -= copied
+    except OSError:
+        return shutil.copy2(source, destination)
+    
+    shutil.copystat(source, destination)
+    return destination
+
+def _clone_tree(source, destination):
+    """
+    Copy a directory tree, sharing file data where the filesystem allows
+
+    On Linux, cp --reflink=auto makes copy-on-write clones on btrfs/XFS,
+    so only metadata is written. Other filesystems get a normal copy.
+    Hardlinks are not used because in-place edits would change the backup too.
+    """
+    if _CP:
+        subprocess.run([_CP, "-a", "--reflink=auto", source, destination], check=True)
+    else:
+        shutil.copytree(source, destination, copy_function=_fast_copy)
+
+def _walk_files(root, prefix=""):
+    """Yield (relative path, full path) for every file under root"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            relpath = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from _walk_files(entry.path, relpath + "/")
+            elif entry.is_file(follow_symlinks=False):
+                yield relpath, entry.path
+
+def _hash_file(path):
+    """Content hash of a file, read in chunks"""
+    digest = hashlib.new(HASH_ALGORITHM)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _object_path(digest):
+    return os.path.join(OBJECTS_PATH, digest[:2], digest[2:])
+
+def _backup_names():
+    """Yield backup names from manifests and from older full-copy directories"""
+    if os.path.isdir(SNAPSHOTS_PATH):
+        with os.scandir(SNAPSHOTS_PATH) as entries:
+            for entry in entries:
+                if entry.name.startswith("backup_") and entry.name.endswith(".json"):
+                    yield entry.name[:-5]
+    if os.path.isdir(BACKUP_PATH):
+        with os.scandir(BACKUP_PATH) as entries:
+            for entry in entries:
+                if entry.name.startswith("backup_") and entry.is_dir():
+                    yield entry.name
 
 class RollbackManager:
     """Manage backups and rollbacks"""
     
     def __init__(self):
-        os.makedirs(BACKUP_PATH, exist_ok=True)
+        os.makedirs(OBJECTS_PATH, exist_ok=True)
+        os.makedirs(SNAPSHOTS_PATH, exist_ok=True)
     
     def create_backup(self):
-        """Create backup of current code"""
+        """
+        Create backup of current code
+        
+        Each file is stored once under backup/objects by content hash, and the
+        backup itself is a small manifest mapping paths to hashes. Files that
+        haven't changed since an earlier backup take no extra space.
+        
+        Returns:
+            str: Backup name, or None on failure
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_dir = os.path.join(BACKUP_PATH, f"backup_{timestamp}")
+        backup_name = f"backup_{timestamp}"
         
         try:
-            shutil.copytree(SRC_PATH, backup_dir)
-            logger.info(f"✅ Backup created: {backup_dir}")
-            return backup_dir
+            files = {}
+            stored = 0
+            for relpath, path in _walk_files(SRC_PATH):
+                digest = _hash_file(path)
+                files[relpath] = digest
+                
+                blob = _object_path(digest)
+                if not os.path.exists(blob):
+                    os.makedirs(os.path.dirname(blob), exist_ok=True)
+                    _fast_copy(path, blob + ".tmp")
+                    os.replace(blob + ".tmp", blob)
+                    stored += 1
+            
+            manifest = {
+                "created_at": datetime.now().isoformat(),
+                "algorithm": HASH_ALGORITHM,
+                "files": files,
+            }
+            with open(os.path.join(SNAPSHOTS_PATH, f"{backup_name}.json"), "w") as f:
+                json.dump(manifest, f, indent=2)
+            
+            logger.info(f"✅ Backup created: {backup_name} ({len(files)} files, {stored} new)")
+            return backup_name
         except Exception as e:
             logger.exception(f"Backup failed: {e}")
             return None
     
+    def list_backups(self):
+        """
+        List available backups, oldest first
+        
+        Includes manifest backups and full-copy backup directories made by
+        older versions.
+        """
+        return sorted(set(_backup_names()))
+    
+    def latest_backup(self):
+        """Name of the newest backup, or None (timestamped names sort by age)"""
+        return max(_backup_names(), default=None)
+    
     def rollback(self, backup_name=None):
         """Rollback to previous version"""
-        if not os.path.exists(BACKUP_PATH):
-            logger.error("No backups found")
-            return False
+        backup_name = backup_name or self.latest_backup()
         
-        backups = sorted([d for d in os.listdir(BACKUP_PATH) if d.startswith("backup_")])
-        
-        if not backups:
-            logger.error("No backup directories found")
+        if not backup_name:
+            logger.error("No backups found")
             return False
         
-        if backup_name:
-            source = os.path.join(BACKUP_PATH, backup_name)
-        else:
-            source = os.path.join(BACKUP_PATH, backups[-1])  # Latest backup
+        manifest_file = os.path.join(SNAPSHOTS_PATH, f"{backup_name}.json")
+        legacy_dir = os.path.join(BACKUP_PATH, backup_name)
         
         try:
-            if os.path.exists(SRC_PATH):
-                shutil.rmtree(SRC_PATH)
-            shutil.copytree(source, SRC_PATH)
-            logger.info(f"🔄 Rollback successful: {source}")
+            if os.path.exists(manifest_file):
+                with open(manifest_file, "r") as f:
+                    files = json.load(f)["files"]
+                
+                missing = [p for p, digest in files.items() if not os.path.exists(_object_path(digest))]
+                if missing:
+                    logger.error(f"Backup {backup_name} is missing {len(missing)} stored files")
+                    return False
+                
+                if os.path.exists(SRC_PATH):
+                    shutil.rmtree(SRC_PATH)
+                for relpath, digest in files.items():
+                    target = os.path.join(SRC_PATH, relpath)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    _fast_copy(_object_path(digest), target)
+            elif os.path.isdir(legacy_dir):
+                if os.path.exists(SRC_PATH):
+                    shutil.rmtree(SRC_PATH)
+                _clone_tree(legacy_dir, SRC_PATH)
+            else:
+                logger.error(f"Backup not found: {backup_name}")
+                return False
+            
+            logger.info(f"🔄 Rollback successful: {backup_name}")
             return True
         except Exception as e:
             logger.exception(f"Rollback failed: {e}")
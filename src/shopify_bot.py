@@ -3,20 +3,80 @@ Complete Shopify Bot Implementation
 Universal bot for Shopify-based stores
 """
 
+import asyncio
 import requests
 import json
-import time
-import sys
-import os
+import random
+import re
+import zlib
 from urllib.parse import urljoin
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 from config.settings import SHOPIFY_CONFIG
 from utils.logger import logger, log_bot_action, log_stock_alert
 from src.proxy_manager import get_random_proxy
 from utils.helper_functions import random_delay
 
+MONITOR_JITTER = 0.5  # max extra seconds added to each poll interval
+
+
+def _loads(content):
+    """Parse a JSON response body, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _hash_body(content):
+    """Cheap fingerprint of a response body, using xxh3 when available"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(content)
+    return zlib.crc32(content)
+
+def build_keyword_matcher(keywords):
+    """
+    Build a case-insensitive "title contains any keyword" test
+    
+    All keywords are matched in a single pass over the title, using an
+    Aho-Corasick automaton when pyahocorasick is installed and one
+    alternation regex otherwise.
+    
+    Args:
+        keywords: Keywords to look for
+        
+    Returns:
+        callable: Takes a lowercased title, returns True on any match
+    """
+    lowered = {keyword.lower() for keyword in keywords if keyword}
+    if not lowered:
+        return lambda title: False
+    
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for keyword in lowered:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda title: next(automaton.iter(title), None) is not None
+    
+    pattern = re.compile("|".join(re.escape(keyword) for keyword in lowered))
+    return lambda title: pattern.search(title) is not None
+
 class ShopifyBot:
     """Universal Shopify store bot"""
     
@@ -24,20 +84,38 @@ class ShopifyBot:
         self.store_url = store_url.rstrip('/')
         self.use_proxy = use_proxy
         self.session = requests.Session()
+        self._etags = {}
+        self._body_hashes = {}
         
         if use_proxy:
             proxy = get_random_proxy()
             if proxy:
                 self.session.proxies = {"http": proxy, "https": proxy}
     
-    def get_products(self):
-        """Get all products via products.json"""
+    def _unchanged(self, key, content):
+        """True if this body is byte-identical to the last one seen for key"""
+        digest = _hash_body(content)
+        if self._body_hashes.get(key) == digest:
+            return True
+        self._body_hashes[key] = digest
+        return False
+    
+    def get_products(self, skip_unchanged=False):
+        """
+        Get all products via products.json
+        
+        Args:
+            skip_unchanged: Return None instead of re-parsing a catalog that
+                is byte-identical to the last one fetched
+        """
         try:
             url = f"{self.store_url}/products.json"
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                if skip_unchanged and self._unchanged(url, response.content):
+                    return None
+                data = _loads(response.content)
                 return data.get("products", [])
             else:
                 logger.error(f"Failed to get products: {response.status_code}")
@@ -47,43 +125,108 @@ class ShopifyBot:
             logger.exception(f"Error getting products: {e}")
             return []
     
-    def monitor_stock(self, keywords, check_interval=None):
-        """Monitor for stock with keywords"""
+    def get_product(self, handle):
+        """
+        Get a single product via /products/<handle>.js
+        
+        Sends If-None-Match with the product's last ETag, so an unchanged
+        product costs an empty 304 response.
+        
+        Args:
+            handle: Product handle
+            
+        Returns:
+            dict: Product data, or None if unchanged or on error
+        """
+        try:
+            url = f"{self.store_url}/products/{handle}.js"
+            etag = self._etags.get(handle)
+            headers = {"If-None-Match": etag} if etag else None
+            response = self.session.get(url, headers=headers, timeout=10)
+            
+            if response.status_code == 304:
+                return None
+            if response.status_code == 200:
+                self._etags[handle] = response.headers.get("ETag")
+                if self._unchanged(url, response.content):
+                    return None
+                return _loads(response.content)
+            
+            logger.error(f"Failed to get product {handle}: {response.status_code}")
+            return None
+                
+        except Exception as e:
+            logger.exception(f"Error getting product {handle}: {e}")
+            return None
+    
+    @staticmethod
+    def _available_variant(product):
+        """Get the first in-stock variant of a product as a monitor result"""
+        for variant in product.get("variants", []):
+            if variant.get("available"):
+                price = variant.get("price")
+                if isinstance(price, int):  # products/<handle>.js prices are in cents
+                    price = f"{price / 100:.2f}"
+                return {
+                    "product_id": product["id"],
+                    "variant_id": variant["id"],
+                    "title": product["title"],
+                    "price": price,
+                }
+        return None
+    
+    async def monitor_stock(self, keywords, check_interval=None):
+        """
+        Monitor for stock with keywords
+        
+        Runs as a coroutine so one event loop can supervise many monitors;
+        the blocking HTTP calls run in worker threads.
+        
+        The full products.json catalog is only fetched to find products
+        matching the keywords. Once some are found, only those products are
+        polled via their handle.js endpoint, and the catalog is refetched
+        every catalog_refresh_polls polls to pick up new listings. Bodies
+        identical to the previous poll are not parsed again.
+        """
         interval = check_interval or SHOPIFY_CONFIG.get("monitor_interval", 2)
+        refresh_polls = SHOPIFY_CONFIG.get("catalog_refresh_polls", 30)
         
         log_bot_action("Stock Monitor", "Shopify", f"Monitoring {self.store_url}")
+        matches = build_keyword_matcher(keywords)
+        handles = []
+        polls = 0
+        loop = asyncio.get_running_loop()
         
         while True:
             try:
-                products = self.get_products()
-                
-                for product in products:
-                    title = product.get("title", "").lower()
-                    
-                    # Check if any keyword matches
-                    if any(keyword.lower() in title for keyword in keywords):
-                        # Check if in stock
-                        variants = product.get("variants", [])
-                        for variant in variants:
-                            if variant.get("available"):
+                if not handles or polls % refresh_polls == 0:
+                    # None means the catalog hasn't changed, so the
+                    # previous matches still stand
+                    products = await loop.run_in_executor(None, self.get_products, True)
+                    if products is not None:
+                        handles = []
+                    for product in products or ():
+                        # Check if any keyword matches
+                        if matches(product.get("title", "").lower()):
+                            result = self._available_variant(product)
+                            if result:
                                 log_stock_alert("Shopify", product["title"])
-                                return {
-                                    "product_id": product["id"],
-                                    "variant_id": variant["id"],
-                                    "title": product["title"],
-                                    "price": variant.get("price"),
-                                }
+                                return result
+                            handles.append(product["handle"])
+                else:
+                    for handle in handles:
+                        product = await loop.run_in_executor(None, self.get_product, handle)
+                        result = product and self._available_variant(product)
+                        if result:
+                            log_stock_alert("Shopify", product["title"])
+                            return result
                 
-                time.sleep(interval)
+                polls += 1
+                await asyncio.sleep(interval + random.uniform(0, MONITOR_JITTER))
                 
-            except KeyboardInterrupt:
-                logger.info("Stock monitoring stopped")
-                break
             except Exception as e:
                 logger.exception(f"Stock monitor error: {e}")
-                time.sleep(interval)
-        
-        return None
+                await asyncio.sleep(interval + random.uniform(0, MONITOR_JITTER))
     
     def add_to_cart(self, variant_id, quantity=1):
         """Add item to cart via cart API"""
@@ -119,8 +262,23 @@ class ShopifyBot:
 
 def monitor_shopify_stock(store_url, keywords):
     """Monitor Shopify store for keywords"""
-    bot = ShopifyBot(store_url)
-    return bot.monitor_stock(keywords)
+    return monitor_shopify_stores([store_url], keywords)[0]
+
+def monitor_shopify_stores(store_urls, keywords):
+    """
+    Monitor several Shopify stores for keywords on one event loop
+    
+    Returns:
+        list: Each store's first in-stock match, or None if interrupted
+    """
+    async def _monitor_all():
+        return await asyncio.gather(*(ShopifyBot(url).monitor_stock(keywords) for url in store_urls))
+    
+    try:
+        return asyncio.run(_monitor_all())
+    except KeyboardInterrupt:
+        logger.info("Stock monitoring stopped")
+        return [None] * len(store_urls)
 
 def checkout_shopify(store_url, variant_id, size=None):
     """Quick checkout on Shopify"""
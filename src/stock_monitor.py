@@ -2,17 +2,82 @@
 Stock Monitoring System
 Monitors multiple platforms for restocks
 """
-import requests
-import time
-import sys
-import os
+import asyncio
+import random
+import re
 from datetime import datetime
+from typing import Optional
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import httpx
 
 from utils.logger import logger, log_stock_alert
 from src.notifications import send_discord_notification
 from config.settings import MONITORING_CONFIG
+from utils.http_client import HTTP2_AVAILABLE, create_session
+
+OUT_OF_STOCK_INDICATORS = (
+    "out of stock",
+    "sold out",
+    "unavailable",
+    "not available"
+)
+
+# One case-insensitive pass over the raw body instead of lowercasing it and
+# scanning once per indicator
+_OUT_OF_STOCK_RE = re.compile(
+    b"|".join(re.escape(indicator.encode()) for indicator in OUT_OF_STOCK_INDICATORS),
+    re.IGNORECASE
+)
+_SCAN_OVERLAP = max(len(indicator) for indicator in OUT_OF_STOCK_INDICATORS) - 1
+CHUNK_SIZE = 8192
+MONITOR_JITTER = 0.5  # max extra seconds added to each poll interval
+
+# Keep-alive pool shared by every synchronous stock check
+_session = create_session(backoff_factor=0.2)
+
+class _StockScanner:
+    """Incremental out of stock scan over a streamed page body"""
+    
+    __slots__ = ("tail",)
+    
+    def __init__(self):
+        self.tail = b""
+    
+    def feed(self, chunk):
+        """
+        Scan the next chunk of the body
+        
+        The last few bytes of each chunk are carried over so indicators split
+        across chunk boundaries are still found.
+        
+        Returns:
+            bool: True once an out of stock indicator has been seen
+        """
+        buffer = self.tail + chunk
+        if _OUT_OF_STOCK_RE.search(buffer):
+            return True
+        self.tail = buffer[-_SCAN_OVERLAP:]
+        return False
+
+class MonitorItem:
+    """A monitored product and its last poll state"""
+    
+    # Hand-written rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("platform", "url", "keywords", "last_check", "in_stock", "etag", "last_modified")
+    
+    def __init__(self, platform: str, url: str, keywords: tuple = (),
+                 last_check: Optional[datetime] = None, in_stock: bool = False,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.platform = platform
+        self.url = url
+        self.keywords = keywords
+        self.last_check = last_check
+        self.in_stock = in_stock
+        self.etag = etag
+        self.last_modified = last_modified
+    
+    def __repr__(self):
+        return f"MonitorItem(platform={self.platform!r}, url={self.url!r}, in_stock={self.in_stock!r})"
 
 class StockMonitor:
     """Multi-platform stock monitor"""
@@ -20,68 +85,128 @@ class StockMonitor:
     def __init__(self):
         self.monitoring = []
         self.check_interval = MONITORING_CONFIG.get("check_interval", 5)
+        self.client = None
+    
+    def _get_client(self):
+        """One pooled HTTP/2 client per monitor so polls reuse connections"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(10.0, connect=3.0),
+                headers={"Accept-Encoding": "gzip, deflate"},
+                follow_redirects=True,
+            )
+        return self.client
     
     def add_monitor(self, platform, product_url, keywords=None):
         """Add a product to monitor"""
-        self.monitoring.append({
-            "platform": platform,
-            "url": product_url,
-            "keywords": keywords or [],
-            "last_check": None,
-            "in_stock": False
-        })
+        self.monitoring.append(MonitorItem(platform, product_url, tuple(keywords or ())))
         logger.info(f"Added monitor: {platform} - {product_url}")
     
     def check_stock_generic(self, url):
-        """Generic stock check via HTTP"""
+        """
+        Generic stock check via HTTP
+        
+        The page is streamed and the download stops at the first out of
+        stock indicator, so pages with an early "sold out" banner aren't
+        pulled in full.
+        """
         try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                # Simple check - look for common out of stock indicators
-                content = response.text.lower()
-                out_of_stock_indicators = [
-                    "out of stock",
-                    "sold out",
-                    "unavailable",
-                    "not available"
-                ]
+            with _session.get(url, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    return False
                 
-                for indicator in out_of_stock_indicators:
-                    if indicator in content:
+                scanner = _StockScanner()
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if scanner.feed(chunk):
                         return False
-                
                 return True  # Likely in stock
+        except Exception as e:
+            logger.error(f"Stock check error for {url}: {e}")
             return False
+    
+    async def check_stock_async(self, url, item=None):
+        """
+        Stock check on the shared async client, stopping at the first indicator
+        
+        When a monitor item is given, the request is conditional on its last
+        ETag/Last-Modified, and a 304 keeps the previous stock state without
+        downloading or scanning the page.
+        """
+        headers = {}
+        if item is not None:
+            if item.etag:
+                headers["If-None-Match"] = item.etag
+            if item.last_modified:
+                headers["If-Modified-Since"] = item.last_modified
+        
+        try:
+            async with self._get_client().stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and item is not None:
+                    return item.in_stock
+                if response.status_code != 200:
+                    self._clear_validators(item)
+                    return False
+                
+                scanner = _StockScanner()
+                in_stock = True  # Likely in stock unless an indicator turns up
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    if scanner.feed(chunk):
+                        in_stock = False
+                        break
+                
+                # Only a completed scan may be reused on a later 304
+                if item is not None:
+                    item.etag = response.headers.get("ETag")
+                    item.last_modified = response.headers.get("Last-Modified")
+                return in_stock
         except Exception as e:
             logger.error(f"Stock check error for {url}: {e}")
+            self._clear_validators(item)
             return False
     
-    def start_monitoring(self):
-        """Start monitoring loop"""
+    @staticmethod
+    def _clear_validators(item):
+        """Forget an item's validators so the next poll fetches and scans the page in full"""
+        if item is not None:
+            item.etag = item.last_modified = None
+    
+    async def start_monitoring(self):
+        """Start monitoring loop, polling every product concurrently each cycle"""
         logger.info(f"Starting stock monitor ({len(self.monitoring)} products)")
         
         try:
             while True:
-                for item in self.monitoring:
-                    current_stock = self.check_stock_generic(item["url"])
-                    
+                results = await asyncio.gather(*(self.check_stock_async(item.url, item) for item in self.monitoring))
+                
+                for item, current_stock in zip(self.monitoring, results):
                     # If newly in stock, notify
-                    if current_stock and not item["in_stock"]:
-                        log_stock_alert(item["platform"], item["url"])
+                    if current_stock and not item.in_stock:
+                        log_stock_alert(item.platform, item.url)
                         
                         if MONITORING_CONFIG.get("notify_on_restock"):
-                            message = f"🔥 RESTOCK: {item['platform']}\n{item['url']}"
+                            message = f"🔥 RESTOCK: {item.platform}\n{item.url}"
                             send_discord_notification(message)
                     
-                    item["in_stock"] = current_stock
-                    item["last_check"] = datetime.now()
+                    item.in_stock = current_stock
+                    item.last_check = datetime.now()
                 
-                time.sleep(self.check_interval)
+                await asyncio.sleep(self.check_interval + random.uniform(0, MONITOR_JITTER))
                 
-        except KeyboardInterrupt:
-            logger.info("Stock monitoring stopped by user")
         except Exception as e:
             logger.exception(f"Stock monitor error: {e}")
+        finally:
+            if self.client is not None:
+                await self.client.aclose()
+                self.client = None
+    
+    def run(self):
+        """Run the monitoring loop until interrupted"""
+        try:
+            asyncio.run(self.start_monitoring())
+        except KeyboardInterrupt:
+            logger.info("Stock monitoring stopped by user")
 
 def check_stock(product_url):
     """Quick stock check"""
@@ -1,12 +1,17 @@
 """Supabase client and database utilities for SneakerBot Ultimate."""
 
+import asyncio
+import atexit
 import os
 import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List, Sequence
 from uuid import uuid4
 import logging
-from functools import lru_cache
 
 try:
     from supabase import create_client, Client
@@ -15,8 +20,235 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     Client = None
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import psycopg
+    from psycopg import sql
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+try:
+    from utils.http_client import HTTP2_AVAILABLE
+except ImportError:  # utils.http_client also needs requests
+    HTTP2_AVAILABLE = False
+
+from src.cache import TTLCache, request_memoized, ttl_cache
+
 logger = logging.getLogger(__name__)
 
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+ACCOUNT_CACHE_TTL = 30  # seconds
+SESSION_CACHE_TTL = 60
+METRICS_CACHE_TTL = 300
+
+METRICS_SUMMARY_COLUMNS = "total_attempts, successful_attempts, failed_attempts"
+
+_metrics_cache = TTLCache(maxsize=256, ttl=METRICS_CACHE_TTL)
+
+BATCH_MAX_ROWS = 500
+BATCH_FLUSH_INTERVAL = 0.25  # seconds
+BACKGROUND_WRITE_WORKERS = 4
+PROXY_STATS_MAX_ENTRIES = 256
+PROXY_STATS_FLUSH_INTERVAL = 2.0  # seconds
+BOT_RUN_INSERT_CHUNK = 1000  # keeps bulk inserts under PostgREST's payload limit
+
+TIMESTAMP_RESOLUTION = 0.1  # seconds
+
+_ts_cache = ("", 0.0)
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601, reformatted at most every TIMESTAMP_RESOLUTION."""
+    global _ts_cache
+    now = time.time()
+    if now - _ts_cache[1] >= TIMESTAMP_RESOLUTION:
+        _ts_cache = (datetime.utcfromtimestamp(now).isoformat(), now)
+    return _ts_cache[0]
+
+
+if HTTPX_AVAILABLE:
+    class _StaleRetryTransport(httpx.HTTPTransport):
+        """Retry idempotent requests once when a pooled connection was closed by the server."""
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            try:
+                return super().handle_request(request)
+            except httpx.RemoteProtocolError:
+                if request.method not in IDEMPOTENT_METHODS:
+                    raise
+                return super().handle_request(request)
+
+
+class _BatchWriter:
+    """Buffers inserts per table and writes them in bulk from a background thread."""
+
+    def __init__(self, client: "Client", max_rows: int = BATCH_MAX_ROWS, interval: float = BATCH_FLUSH_INTERVAL):
+        """Initialize batch writer."""
+        self.client = client
+        self.max_rows = max_rows
+        self.interval = interval
+        self._buffers: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._updates: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(self, table: str, row: Dict[str, Any]) -> None:
+        """Queue a row for insert; a full buffer is flushed right away."""
+        with self._lock:
+            self._buffers[table].append(row)
+            if "id" in row:
+                self._pending[row["id"]] = row
+            full = len(self._buffers[table]) >= self.max_rows
+
+            self._start_locked()
+
+        if full:
+            self._wake.set()
+
+    def update(self, table: str, row_id: str, changes: Dict[str, Any]) -> None:
+        """Queue an update by id; updates to the same row before a flush are merged into one."""
+        with self._lock:
+            self._updates.setdefault((table, row_id), {}).update(changes)
+            self._start_locked()
+
+    def update_pending(self, row_id: str, changes: Dict[str, Any]) -> bool:
+        """Apply changes to a row that hasn't been written yet; False if already sent."""
+        with self._lock:
+            row = self._pending.get(row_id)
+            if row is None:
+                return False
+            row.update(changes)
+            return True
+
+    def flush(self, table: Optional[str] = None) -> None:
+        """Write buffered rows now, for one table or all of them.
+
+        Returns once the rows, including any flush already in progress,
+        have been sent.
+        """
+        with self._flush_lock:
+            with self._lock:
+                tables = [table] if table else list(self._buffers)
+                batches = {t: self._buffers.pop(t) for t in tables if self._buffers.get(t)}
+                for rows in batches.values():
+                    for row in rows:
+                        self._pending.pop(row.get("id"), None)
+                updates = {
+                    key: self._updates.pop(key)
+                    for key in list(self._updates)
+                    if table is None or key[0] == table
+                }
+
+            for name, rows in batches.items():
+                for start in range(0, len(rows), self.max_rows):
+                    chunk = rows[start:start + self.max_rows]
+                    try:
+                        self.client.table(name).insert(chunk).execute()
+                    except Exception as e:
+                        logger.error(f"Error writing {len(chunk)} rows to {name}: {e}")
+
+            # Inserts go first so queued updates can target rows from the same flush
+            for (name, row_id), changes in updates.items():
+                try:
+                    self.client.table(name).update(changes).eq("id", row_id).execute()
+                except Exception as e:
+                    logger.error(f"Error updating {name} {row_id}: {e}")
+
+    def _start_locked(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="supabase-batch-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+
+class _ProxyStatsBuffer:
+    """Sums proxy results per (proxy, platform) and sends them in one RPC per flush."""
+
+    def __init__(
+        self,
+        client: "Client",
+        max_entries: int = PROXY_STATS_MAX_ENTRIES,
+        interval: float = PROXY_STATS_FLUSH_INTERVAL,
+    ):
+        """Initialize proxy stats buffer."""
+        self.client = client
+        self.max_entries = max_entries
+        self.interval = interval
+        self._deltas: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, proxy_address: str, platform: str, success: bool, response_time_ms: Optional[int], detected: bool) -> None:
+        """Add one result; a full buffer is flushed right away."""
+        now = _now_iso()
+        with self._lock:
+            delta = self._deltas.get((proxy_address, platform))
+            if delta is None:
+                delta = self._deltas[(proxy_address, platform)] = {
+                    "addr": proxy_address,
+                    "platform": platform,
+                    "successes": 0,
+                    "failures": 0,
+                    "detections": 0,
+                    "rt_ms_sum": 0,
+                    "rt_count": 0,
+                    "last_success": None,
+                }
+            if success:
+                delta["successes"] += 1
+                delta["last_success"] = now
+            else:
+                delta["failures"] += 1
+            if detected:
+                delta["detections"] += 1
+            if response_time_ms is not None:
+                delta["rt_ms_sum"] += response_time_ms
+                delta["rt_count"] += 1
+            delta["last_tested"] = now
+            full = len(self._deltas) >= self.max_entries
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="supabase-proxy-stats", daemon=True)
+                self._thread.start()
+
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Send accumulated results now."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._deltas = list(self._deltas.values()), {}
+
+            if rows:
+                try:
+                    self.client.rpc("add_proxy_perf_batch", {"p_rows": rows}).execute()
+                except Exception as e:
+                    logger.error(f"Error recording performance for {len(rows)} proxies: {e}")
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
 
 class SupabaseManager:
     """Manages all Supabase database operations."""
@@ -25,6 +257,11 @@ class SupabaseManager:
         """Initialize Supabase client."""
         self.client: Optional[Client] = None
         self.initialized = False
+        self._batch: Optional[_BatchWriter] = None
+        self._writes: Optional[ThreadPoolExecutor] = None
+        self._proxy_stats: Optional[_ProxyStatsBuffer] = None
+        self._account_cache = TTLCache(maxsize=4096, ttl=ACCOUNT_CACHE_TTL)
+        self._session_cache = TTLCache(maxsize=4096, ttl=SESSION_CACHE_TTL)
         self._init_client()
 
     def _init_client(self) -> None:
@@ -42,15 +279,77 @@ class SupabaseManager:
                 return
 
             self.client = create_client(url, key)
+            self._init_http_pool()
+            self._batch = _BatchWriter(self.client)
+            atexit.register(self._batch.flush)
+            self._proxy_stats = _ProxyStatsBuffer(self.client)
+            atexit.register(self._proxy_stats.flush)
+            self._writes = ThreadPoolExecutor(BACKGROUND_WRITE_WORKERS, thread_name_prefix="sb-write")
+            atexit.register(self._writes.shutdown, wait=True)  # runs before the batch flush
             self.initialized = True
             logger.info("Supabase client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Supabase: {e}")
 
+    def _init_http_pool(self) -> None:
+        """Route all PostgREST calls through one pooled keep-alive HTTP client."""
+        if not HTTPX_AVAILABLE:
+            return
+
+        try:
+            postgrest = self.client.postgrest
+            default_session = postgrest.session
+            postgrest.session = httpx.Client(
+                base_url=default_session.base_url,
+                headers=default_session.headers,
+                timeout=httpx.Timeout(10.0, connect=2.0),
+                transport=_StaleRetryTransport(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30),
+                ),
+            )
+            default_session.close()
+        except Exception as e:
+            logger.warning(f"Could not configure Supabase HTTP pool, using defaults: {e}")
+
     def is_connected(self) -> bool:
         """Check if Supabase is connected."""
         return self.initialized and self.client is not None
 
+    def flush(self) -> None:
+        """Write all batched inserts and buffered proxy stats now."""
+        if self._batch:
+            self._batch.flush()
+        if self._proxy_stats:
+            self._proxy_stats.flush()
+
+    def bulk_copy(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]]) -> int:
+        """Load rows with Postgres COPY over a direct connection, for large backfills."""
+        if not PSYCOPG_AVAILABLE:
+            logger.warning("psycopg not available. Install with: pip install psycopg[binary]")
+            return 0
+
+        db_url = os.getenv("SUPABASE_DB_URL")
+        if not db_url:
+            logger.warning("SUPABASE_DB_URL not set in environment")
+            return 0
+
+        statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table), sql.SQL(", ").join(map(sql.Identifier, columns))
+        )
+        try:
+            # Fresh connection per load: nothing is left prepared on a pooled Supavisor connection
+            count = 0
+            with psycopg.connect(db_url) as conn, conn.cursor() as cur:
+                with cur.copy(statement) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                        count += 1
+            return count
+        except Exception as e:
+            logger.error(f"Error bulk loading {table}: {e}")
+            return 0
+
     # Account Management
     def create_account(
         self,
@@ -74,7 +373,7 @@ class SupabaseManager:
                 "account_name": account_name,
                 "notes": notes,
                 "status": "active",
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": _now_iso(),
             }
 
             response = self.client.table("accounts").insert(data).execute()
@@ -86,17 +385,27 @@ class SupabaseManager:
             return None
 
     def get_account(self, account_id: str) -> Optional[Dict[str, Any]]:
-        """Get account by ID."""
+        """Get account by ID, cached for ACCOUNT_CACHE_TTL seconds."""
         if not self.is_connected():
             return None
 
+        account = self._account_cache.get(account_id)
+        if account is not None:
+            return account
+
         try:
             response = self.client.table("accounts").select("*").eq("id", account_id).maybeSingle().execute()
+            if response.data:
+                self._account_cache.set(account_id, response.data)
             return response.data
         except Exception as e:
             logger.error(f"Error getting account: {e}")
             return None
 
+    def invalidate_account(self, account_id: str) -> None:
+        """Drop an account from the read cache after an outside update."""
+        self._account_cache.pop(account_id)
+
     def get_accounts_by_platform(self, platform: str) -> List[Dict[str, Any]]:
         """Get all accounts for a platform."""
         if not self.is_connected():
@@ -112,35 +421,32 @@ class SupabaseManager:
             return []
 
     def update_account_usage(self, account_id: str) -> bool:
-        """Update last_used timestamp."""
+        """Update last_used timestamp in the background; returns once queued."""
         if not self.is_connected():
             return False
 
+        self._account_cache.pop(account_id)
+        self._writes.submit(self._update_account_usage_sync, account_id, _now_iso())
+        return True
+
+    def _update_account_usage_sync(self, account_id: str, last_used: str) -> None:
         try:
-            self.client.table("accounts").update({"last_used": datetime.utcnow().isoformat()}).eq("id", account_id).execute()
-            return True
+            self.client.table("accounts").update({"last_used": last_used}).eq("id", account_id).execute()
+            self._account_cache.pop(account_id)
         except Exception as e:
             logger.error(f"Error updating account: {e}")
-            return False
 
     def update_account_stats(self, account_id: str, success: bool) -> bool:
-        """Update account success/failure counts."""
+        """Atomically increment account success/failure counts."""
         if not self.is_connected():
             return False
 
         try:
-            account = self.get_account(account_id)
-            if not account:
-                return False
-
-            if success:
-                new_success = (account.get("success_count") or 0) + 1
-                self.client.table("accounts").update({"success_count": new_success}).eq("id", account_id).execute()
-            else:
-                new_failure = (account.get("failure_count") or 0) + 1
-                self.client.table("accounts").update({"failure_count": new_failure}).eq("id", account_id).execute()
-
-            return True
+            response = self.client.rpc(
+                "increment_account_stats", {"p_id": account_id, "p_success": success}
+            ).execute()
+            self._account_cache.pop(account_id)
+            return bool(response.data)
         except Exception as e:
             logger.error(f"Error updating account stats: {e}")
             return False
@@ -168,7 +474,7 @@ class SupabaseManager:
                 "proxy_used": proxy,
                 "user_agent": user_agent,
                 "status": "active",
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": _now_iso(),
                 "expires_at": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
             }
 
@@ -181,14 +487,20 @@ class SupabaseManager:
             return None
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session by ID."""
+        """Get active session by ID, cached for SESSION_CACHE_TTL seconds."""
         if not self.is_connected():
             return None
 
+        session = self._session_cache.get(session_id)
+        if session is not None:
+            return session
+
         try:
             response = (
                 self.client.table("bot_sessions").select("*").eq("id", session_id).eq("status", "active").maybeSingle().execute()
             )
+            if response.data:
+                self._session_cache.set(session_id, response.data)
             return response.data
         except Exception as e:
             logger.error(f"Error getting session: {e}")
@@ -205,47 +517,66 @@ class SupabaseManager:
         target_size: Optional[str] = None,
     ) -> Optional[str]:
         """Create a new bot run record."""
-        if not self.is_connected():
-            return None
-
-        try:
-            data = {
+        runs = self.create_bot_runs([
+            {
                 "session_id": session_id,
                 "account_id": account_id,
                 "platform": platform,
                 "bot_type": bot_type,
                 "sneaker_name": sneaker_name,
                 "target_size": target_size,
-                "status": "pending",
-                "started_at": datetime.utcnow().isoformat(),
             }
+        ])
+        return runs[0] if runs else None
 
-            response = self.client.table("bot_runs").insert(data).execute()
-            if response.data:
-                return response.data[0]["id"]
-            return None
+    def create_bot_runs(self, runs: List[Dict[str, Any]]) -> List[str]:
+        """Create many bot run records with one insert per BOT_RUN_INSERT_CHUNK rows."""
+        if not self.is_connected() or not runs:
+            return []
+
+        try:
+            started_at = _now_iso()
+            rows = [
+                {
+                    "sneaker_name": None,
+                    "target_size": None,
+                    **run,
+                    "status": "pending",
+                    "started_at": started_at,
+                }
+                for run in runs
+            ]
+
+            ids = []
+            for i in range(0, len(rows), BOT_RUN_INSERT_CHUNK):
+                response = self.client.table("bot_runs").insert(rows[i:i + BOT_RUN_INSERT_CHUNK]).execute()
+                ids.extend(row["id"] for row in response.data or [])
+            return ids
         except Exception as e:
-            logger.error(f"Error creating bot run: {e}")
-            return None
+            logger.error(f"Error creating bot runs: {e}")
+            return []
 
     def update_bot_run(self, run_id: str, **kwargs) -> bool:
-        """Update bot run record."""
+        """Update bot run record.
+
+        Updates are coalesced per run and written by the batch writer; the
+        final update (completed_at set) is written before returning.
+        """
         if not self.is_connected():
             return False
 
-        try:
-            update_data = {}
-            for key, value in kwargs.items():
-                if key == "completed_at" and value is True:
-                    update_data["completed_at"] = datetime.utcnow().isoformat()
-                else:
-                    update_data[key] = value
-
-            self.client.table("bot_runs").update(update_data).eq("id", run_id).execute()
+        update_data = {
+            key: _now_iso() if key == "completed_at" and value is True else value
+            for key, value in kwargs.items()
+            if value is not None
+        }
+        if not update_data:
             return True
-        except Exception as e:
-            logger.error(f"Error updating bot run: {e}")
-            return False
+
+        self._batch.update("bot_runs", run_id, update_data)
+        if "completed_at" in update_data:
+            self._batch.flush("bot_runs")
+        return True
 
     def get_bot_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         """Get bot run by ID."""
@@ -253,6 +584,7 @@ class SupabaseManager:
             return None
 
         try:
+            self._batch.flush("bot_runs")
             response = self.client.table("bot_runs").select("*").eq("id", run_id).maybeSingle().execute()
             return response.data
         except Exception as e:
@@ -269,25 +601,27 @@ class SupabaseManager:
         product_size: Optional[str] = None,
         stage: Optional[str] = None,
     ) -> Optional[str]:
-        """Create purchase attempt record."""
+        """Create purchase attempt record; the row is written with the next batch."""
         if not self.is_connected():
             return None
 
         try:
+            attempt_id = str(uuid4())
             data = {
+                "id": attempt_id,
                 "bot_run_id": bot_run_id,
                 "account_id": account_id,
                 "platform": platform,
                 "product_name": product_name,
                 "product_size": product_size,
                 "stage": stage,
-                "completed_at": datetime.utcnow().isoformat(),
+                "success": None,
+                "order_id": None,
+                "completed_at": _now_iso(),
             }
 
-            response = self.client.table("purchase_attempts").insert(data).execute()
-            if response.data:
-                return response.data[0]["id"]
-            return None
+            self._batch.enqueue("purchase_attempts", data)
+            return attempt_id
         except Exception as e:
             logger.error(f"Error creating purchase attempt: {e}")
             return None
@@ -302,6 +636,10 @@ class SupabaseManager:
             if order_id:
                 update_data["order_id"] = order_id
 
+            if self._batch.update_pending(attempt_id, update_data):
+                return True
+            self._batch.flush("purchase_attempts")
+
             self.client.table("purchase_attempts").update(update_data).eq("id", attempt_id).execute()
             return True
         except Exception as e:
@@ -319,7 +657,7 @@ class SupabaseManager:
         solve_time_ms: Optional[int] = None,
         cost: Optional[float] = None,
     ) -> bool:
-        """Record CAPTCHA solving attempt."""
+        """Record CAPTCHA solving attempt; written with the next batch."""
         if not self.is_connected():
             return False
 
@@ -332,10 +670,10 @@ class SupabaseManager:
                 "success": success,
                 "solve_time_ms": solve_time_ms,
                 "cost": cost,
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": _now_iso(),
             }
 
-            self.client.table("captcha_attempts").insert(data).execute()
+            self._batch.enqueue("captcha_attempts", data)
             return True
         except Exception as e:
             logger.error(f"Error recording CAPTCHA attempt: {e}")
@@ -349,54 +687,12 @@ class SupabaseManager:
         response_time_ms: Optional[int] = None,
         detected: bool = False,
     ) -> bool:
-        """Record proxy performance metrics."""
+        """Record a proxy result; results are summed per proxy and written every few seconds."""
         if not self.is_connected():
             return False
 
-        try:
-            response = (
-                self.client.table("proxy_performance")
-                .select("*")
-                .eq("proxy_address", proxy_address)
-                .eq("platform", platform)
-                .maybeSingle()
-                .execute()
-            )
-
-            if response.data:
-                # Update existing record
-                perf = response.data
-                new_success_count = perf.get("success_count", 0) + (1 if success else 0)
-                new_failure_count = perf.get("failure_count", 0) + (0 if success else 1)
-                new_detection_count = perf.get("detection_count", 0) + (1 if detected else 0)
-
-                self.client.table("proxy_performance").update(
-                    {
-                        "success_count": new_success_count,
-                        "failure_count": new_failure_count,
-                        "detection_count": new_detection_count,
-                        "last_tested": datetime.utcnow().isoformat(),
-                        "last_success": datetime.utcnow().isoformat() if success else perf.get("last_success"),
-                    }
-                ).eq("proxy_address", proxy_address).eq("platform", platform).execute()
-            else:
-                # Create new record
-                data = {
-                    "proxy_address": proxy_address,
-                    "platform": platform,
-                    "success_count": 1 if success else 0,
-                    "failure_count": 0 if success else 1,
-                    "detection_count": 1 if detected else 0,
-                    "last_tested": datetime.utcnow().isoformat(),
-                    "last_success": datetime.utcnow().isoformat() if success else None,
-                    "created_at": datetime.utcnow().isoformat(),
-                }
-                self.client.table("proxy_performance").insert(data).execute()
-
-            return True
-        except Exception as e:
-            logger.error(f"Error recording proxy performance: {e}")
-            return False
+        self._proxy_stats.add(proxy_address, platform, success, response_time_ms, detected)
+        return True
 
     def record_notification(
         self,
@@ -406,7 +702,7 @@ class SupabaseManager:
         message: str,
         success: bool,
     ) -> bool:
-        """Record sent notification."""
+        """Record sent notification; written with the next batch."""
         if not self.is_connected():
             return False
 
@@ -417,10 +713,10 @@ class SupabaseManager:
                 "channel": channel,
                 "message": message,
                 "success": success,
-                "sent_at": datetime.utcnow().isoformat(),
+                "sent_at": _now_iso(),
             }
 
-            self.client.table("notifications").insert(data).execute()
+            self._batch.enqueue("notifications", data)
             return True
         except Exception as e:
             logger.error(f"Error recording notification: {e}")
@@ -443,7 +739,7 @@ class SupabaseManager:
                 "platform": platform,
                 "description": description,
                 "status": "active",
-                "started_at": datetime.utcnow().isoformat(),
+                "started_at": _now_iso(),
             }
 
             response = self.client.table("research_sessions").insert(data).execute()
@@ -463,7 +759,7 @@ class SupabaseManager:
             update_data = {}
             for key, value in kwargs.items():
                 if key == "completed_at" and value is True:
-                    update_data["completed_at"] = datetime.utcnow().isoformat()
+                    update_data["completed_at"] = _now_iso()
                 else:
                     update_data[key] = value
 
@@ -474,6 +770,8 @@ class SupabaseManager:
             return False
 
     # Analytics Retrieval
+    @ttl_cache(_metrics_cache)
+    @request_memoized
     def get_platform_metrics(self, platform: str, days: int = 7) -> Dict[str, Any]:
         """Get platform metrics for last N days."""
         if not self.is_connected():
@@ -484,105 +782,159 @@ class SupabaseManager:
 
             response = (
                 self.client.table("analytics_metrics")
-                .select("*")
+                .select(METRICS_SUMMARY_COLUMNS)
                 .eq("platform", platform)
                 .gte("metric_date", date_from)
                 .execute()
             )
 
-            metrics = response.data or []
-
-            if not metrics:
-                return {
-                    "platform": platform,
-                    "total_attempts": 0,
-                    "successful_attempts": 0,
-                    "failed_attempts": 0,
-                    "success_rate": 0,
-                }
-
-            total_attempts = sum(m.get("total_attempts", 0) for m in metrics)
-            successful = sum(m.get("successful_attempts", 0) for m in metrics)
-            failed = sum(m.get("failed_attempts", 0) for m in metrics)
-
-            return {
-                "platform": platform,
-                "total_attempts": total_attempts,
-                "successful_attempts": successful,
-                "failed_attempts": failed,
-                "success_rate": (successful / total_attempts * 100) if total_attempts > 0 else 0,
-                "days": days,
-            }
+            return self._summarize_platform_metrics(platform, response.data or [], days)
         except Exception as e:
             logger.error(f"Error getting metrics: {e}")
             return {}
 
-    def get_captcha_success_rate(self, platform: str, days: int = 7) -> float:
-        """Get CAPTCHA solving success rate."""
+    @request_memoized
+    def get_platform_metrics_bulk(self, platforms: List[str], days: int = 7) -> Dict[str, Dict[str, Any]]:
+        """Get platform metrics for several platforms in one query."""
         if not self.is_connected():
-            return 0
+            return {}
 
         try:
             date_from = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
 
             response = (
-                self.client.table("captcha_attempts")
-                .select("success")
-                .eq("platform", platform)
-                .gte("created_at", date_from)
+                self.client.table("analytics_metrics")
+                .select("platform, " + METRICS_SUMMARY_COLUMNS)
+                .in_("platform", list(platforms))
+                .gte("metric_date", date_from)
                 .execute()
             )
 
-            attempts = response.data or []
-            if not attempts:
-                return 0
+            rows_by_platform: Dict[str, List[Dict[str, Any]]] = {platform: [] for platform in platforms}
+            for row in response.data or []:
+                rows_by_platform.setdefault(row.get("platform"), []).append(row)
+
+            return {
+                platform: self._summarize_platform_metrics(platform, rows, days)
+                for platform, rows in rows_by_platform.items()
+            }
+        except Exception as e:
+            logger.error(f"Error getting bulk metrics: {e}")
+            return {}
+
+    @staticmethod
+    def _summarize_platform_metrics(platform: str, metrics: List[Dict[str, Any]], days: int) -> Dict[str, Any]:
+        """Sum daily metric rows into one platform summary."""
+        if not metrics:
+            return {
+                "platform": platform,
+                "total_attempts": 0,
+                "successful_attempts": 0,
+                "failed_attempts": 0,
+                "success_rate": 0,
+            }
+
+        total_attempts = sum(m.get("total_attempts", 0) for m in metrics)
+        successful = sum(m.get("successful_attempts", 0) for m in metrics)
+        failed = sum(m.get("failed_attempts", 0) for m in metrics)
+
+        return {
+            "platform": platform,
+            "total_attempts": total_attempts,
+            "successful_attempts": successful,
+            "failed_attempts": failed,
+            "success_rate": (successful / total_attempts * 100) if total_attempts > 0 else 0,
+            "days": days,
+        }
 
-            successful = sum(1 for a in attempts if a.get("success"))
-            return (successful / len(attempts) * 100) if attempts else 0
+    @request_memoized
+    def get_captcha_success_rate(self, platform: str, days: int = 7) -> float:
+        """Get CAPTCHA solving success rate."""
+        if not self.is_connected():
+            return 0
+
+        try:
+            response = self.client.rpc(
+                "get_captcha_success_rate", {"p_platform": platform, "p_days": days}
+            ).execute()
+            return float(response.data or 0)
         except Exception as e:
             logger.error(f"Error getting CAPTCHA success rate: {e}")
             return 0
 
+    @request_memoized
+    def get_captcha_success_rates(self, days: int = 7) -> Dict[str, float]:
+        """Get CAPTCHA solving success rate for every platform in one query."""
+        if not self.is_connected():
+            return {}
+
+        try:
+            response = self.client.rpc("rpc_captcha_rates", {"p_days": days}).execute()
+            return {r["platform"]: float(r.get("solve_rate") or 0) for r in response.data or []}
+        except Exception as e:
+            logger.error(f"Error getting CAPTCHA success rates: {e}")
+            return {}
+
+    @request_memoized
     def get_bot_run_stats(self, platform: str, bot_type: str, days: int = 7) -> Dict[str, Any]:
         """Get bot run statistics."""
         if not self.is_connected():
             return {}
 
         try:
-            date_from = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
+            response = self.client.rpc(
+                "get_bot_run_stats", {"p_platform": platform, "p_bot_type": bot_type, "p_days": days}
+            ).execute()
 
-            response = (
-                self.client.table("bot_runs")
-                .select("*")
-                .eq("platform", platform)
-                .eq("bot_type", bot_type)
-                .gte("created_at", date_from)
-                .execute()
-            )
-
-            runs = response.data or []
-            if not runs:
+            stats = (response.data or [{}])[0]
+            total_runs = stats.get("total_runs") or 0
+            if not total_runs:
                 return {"platform": platform, "bot_type": bot_type, "total_runs": 0, "success_count": 0, "success_rate": 0}
 
-            successful = sum(1 for r in runs if r.get("success"))
-            durations = [r.get("duration_ms", 0) for r in runs if r.get("duration_ms")]
+            successful = stats.get("success_count") or 0
 
             return {
                 "platform": platform,
                 "bot_type": bot_type,
-                "total_runs": len(runs),
+                "total_runs": total_runs,
                 "success_count": successful,
-                "success_rate": (successful / len(runs) * 100) if runs else 0,
-                "average_duration_ms": sum(durations) / len(durations) if durations else 0,
-                "captcha_required_count": sum(1 for r in runs if r.get("captcha_required")),
-                "detection_triggered_count": sum(1 for r in runs if r.get("detection_triggered")),
+                "success_rate": successful / total_runs * 100,
+                "average_duration_ms": float(stats.get("average_duration_ms") or 0),
+                "captcha_required_count": stats.get("captcha_required_count") or 0,
+                "detection_triggered_count": stats.get("detection_triggered_count") or 0,
             }
         except Exception as e:
             logger.error(f"Error getting bot run stats: {e}")
             return {}
 
+    async def get_dashboard_bundle_async(self, platform: str, bot_type: str, days: int = 7) -> Dict[str, Any]:
+        """Fetch platform metrics, CAPTCHA rate and bot run stats concurrently."""
+        loop = asyncio.get_running_loop()
+        metrics, captcha_rate, bot_run_stats = await asyncio.gather(
+            loop.run_in_executor(None, self.get_platform_metrics, platform, days),
+            loop.run_in_executor(None, self.get_captcha_success_rate, platform, days),
+            loop.run_in_executor(None, self.get_bot_run_stats, platform, bot_type, days),
+        )
+        return {
+            "platform_metrics": metrics,
+            "captcha_success_rate": captcha_rate,
+            "bot_run_stats": bot_run_stats,
+        }
+
+    def get_dashboard_bundle(self, platform: str, bot_type: str, days: int = 7) -> Dict[str, Any]:
+        """Sync wrapper for get_dashboard_bundle_async; not for use inside a running event loop."""
+        return asyncio.run(self.get_dashboard_bundle_async(platform, bot_type, days))
+
+
+_MANAGER: Optional[SupabaseManager] = None
+_manager_lock = threading.Lock()
+
 
-@lru_cache(maxsize=1)
 def get_supabase_manager() -> SupabaseManager:
     """Get or create Supabase manager singleton."""
-    return SupabaseManager()
+    global _MANAGER
+    if _MANAGER is None:
+        with _manager_lock:
+            if _MANAGER is None:
+                _MANAGER = SupabaseManager()
+    return _MANAGER
@@ -2,71 +2,106 @@
 Supreme Bot Implementation
 High-speed checkout for Supreme releases
 """
-import sys
-import os
-from playwright.sync_api import sync_playwright
+import asyncio
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 
 from utils.logger import logger
-from utils.helper_functions import random_delay
+from utils.helper_functions import random_delay_async
 from config.settings import SUPREME_CONFIG
+from src.browser_pool import BrowserPool, run_sync
+
+ACTION_TIMEOUT = 300  # ms; a missing element should cost little on a drop
+
+# Differs from Nike's stealth launch (images off, web security off), so
+# Supreme gets its own shared browser rather than borrowing Nike's
+LAUNCH_OPTIONS = {"headless": False}
+
+_pool = None
+
+def get_supreme_pool():
+    """Context pool for Supreme bots on the shared Supreme browser"""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool(
+            size=SUPREME_CONFIG["max_concurrent_bots"],
+            launch_options=LAUNCH_OPTIONS,
+        )
+    return _pool
 
 class SupremeBot:
     """Supreme-specific bot with speed optimizations"""
     
     def __init__(self):
         self.base_url = SUPREME_CONFIG.get("base_url", "https://www.supremenewyork.com")
+        self.pool = None
+        self.context = None
         self.browser = None
         self.page = None
     
-    def setup_browser(self):
-        """Initialize with speed optimizations"""
-        playwright = sync_playwright().start()
-        self.browser = playwright.chromium.launch(headless=False)
-        self.page = self.browser.new_page()
+    async def setup_browser(self):
+        """Take a context from the shared pool; the browser is only launched once"""
+        self.pool = get_supreme_pool()
+        self.context = await self.pool.acquire()
+        self.browser = self.context.browser
+        self.page = await self.context.new_page()
     
-    def quick_checkout(self, product_url, size, category):
+    async def quick_checkout(self, product_url, size, category):
         """Lightning-fast checkout"""
         logger.info(f"Supreme quick checkout: {product_url}")
         
         try:
-            self.page.goto(product_url)
+            await self.page.goto(product_url)
             
-            # Select size if needed
+            # Select size if needed; pages without a size select just time out
             if size:
-                size_select = self.page.locator("select[name='size']")
-                if size_select.count() > 0:
-                    size_select.select_option(size)
+                try:
+                    await self.page.locator("select[name='size']").select_option(size, timeout=ACTION_TIMEOUT)
+                except PlaywrightTimeout:
+                    pass
             
             # Add to cart (immediate click)
-            add_btn = self.page.locator("input[name='commit']")
-            if add_btn.count() > 0:
-                add_btn.click()
+            try:
+                await self.page.locator("input[name='commit']").click(timeout=ACTION_TIMEOUT)
+            except PlaywrightTimeout:
+                pass
             
-            random_delay(*SUPREME_CONFIG.get("checkout_delay", (0.5, 1.5)))
+            await random_delay_async(*SUPREME_CONFIG.get("checkout_delay", (0.5, 1.5)))
             
             # Checkout
-            checkout_btn = self.page.locator("a:has-text('checkout')")
-            if checkout_btn.count() > 0:
-                checkout_btn.click()
+            try:
+                await self.page.locator("a:has-text('checkout')").click(timeout=ACTION_TIMEOUT)
+            except PlaywrightTimeout:
+                pass
             
             logger.info("✅ Supreme checkout initiated")
             return True
-            
+        
         except Exception as e:
             logger.exception(f"Supreme checkout error: {e}")
             return False
     
-    def cleanup(self):
-        if self.browser:
-            self.browser.close()
+    async def cleanup(self):
+        """Return the context to the pool; the shared browser stays up"""
+        if self.context:
+            await self.pool.release(self.context)
+            self.context = self.page = None
 
-def supreme_checkout(product_url, size=None, category="jackets"):
-    """Quick Supreme checkout"""
+async def supreme_checkout_async(product_url, size=None, category="jackets"):
+    """Quick Supreme checkout, for use inside an event loop"""
     bot = SupremeBot()
-    bot.setup_browser()
+    await bot.setup_browser()
     try:
-        return bot.quick_checkout(product_url, size, category)
+        return await bot.quick_checkout(product_url, size, category)
     finally:
-        bot.cleanup()
+        await bot.cleanup()
+
+async def supreme_checkout_many(product_urls, size=None, category="jackets"):
+    """Run checkouts for several products at once"""
+    return await asyncio.gather(
+        *(supreme_checkout_async(url, size, category) for url in product_urls)
+    )
+
+def supreme_checkout(product_url, size=None, category="jackets"):
+    """Quick Supreme checkout"""
+    return run_sync(supreme_checkout_async(product_url, size, category))
@@ -0,0 +1,29 @@
+/*
+  # Account platform breakdown
+
+  Aggregates account counters per platform server-side so the dashboard
+  receives one row per platform instead of every account row.
+*/
+
+CREATE OR REPLACE FUNCTION get_account_platform_breakdown(p_platform text DEFAULT NULL)
+RETURNS TABLE (
+  platform text,
+  total_accounts bigint,
+  active_accounts bigint,
+  avg_success numeric,
+  avg_failure numeric
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT
+    a.platform,
+    count(*) AS total_accounts,
+    count(*) FILTER (WHERE a.status = 'active') AS active_accounts,
+    coalesce(avg(coalesce(a.success_count, 0)) FILTER (WHERE a.status = 'active'), 0) AS avg_success,
+    coalesce(avg(coalesce(a.failure_count, 0)) FILTER (WHERE a.status = 'active'), 0) AS avg_failure
+  FROM accounts a
+  WHERE p_platform IS NULL OR a.platform = p_platform
+  GROUP BY a.platform;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_accounts_platform_status ON accounts (platform, status);
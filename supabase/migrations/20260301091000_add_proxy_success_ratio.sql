@@ -0,0 +1,15 @@
+/*
+  # Proxy success ratio
+
+  Stored success ratio on proxy_performance so the dashboard can rank the
+  top proxies with an index scan instead of sorting every row client-side.
+*/
+
+ALTER TABLE proxy_performance
+  ADD COLUMN IF NOT EXISTS success_ratio double precision
+  GENERATED ALWAYS AS (
+    coalesce(success_count::double precision / NULLIF(success_count + failure_count, 0), 0)
+  ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_proxy_performance_success_ratio
+  ON proxy_performance (success_ratio DESC);
@@ -0,0 +1,27 @@
+/*
+  # Daily platform trend materialized view
+
+  Precomputed per-platform daily totals for the dashboard trend chart,
+  refreshed hourly by pg_cron so requests never rescan analytics_metrics.
+*/
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_platform_trend AS
+SELECT
+  platform,
+  metric_date,
+  sum(total_attempts)::bigint AS total_attempts,
+  sum(successful_attempts)::bigint AS successful_attempts
+FROM analytics_metrics
+GROUP BY platform, metric_date;
+
+-- Unique index is required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_daily_platform_trend_platform_date
+  ON mv_daily_platform_trend (platform, metric_date);
+
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+SELECT cron.schedule(
+  'refresh-mv-daily-platform-trend',
+  '0 * * * *',
+  $$REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_platform_trend$$
+);
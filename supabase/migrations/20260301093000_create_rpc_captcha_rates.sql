@@ -0,0 +1,26 @@
+/*
+  # CAPTCHA solve rates per platform
+
+  Returns the CAPTCHA solve rate (0-100) of every platform for the last
+  p_days days in a single round-trip.
+*/
+
+CREATE OR REPLACE FUNCTION rpc_captcha_rates(p_days integer DEFAULT 7)
+RETURNS TABLE (
+  platform text,
+  solve_rate double precision
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT
+    c.platform,
+    coalesce(
+      100.0 * sum(CASE WHEN c.success THEN 1 ELSE 0 END)::double precision / NULLIF(count(*), 0),
+      0
+    ) AS solve_rate
+  FROM captcha_attempts c
+  WHERE c.created_at >= (now() - p_days * interval '1 day')::date
+  GROUP BY c.platform;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_captcha_attempts_created_at ON captcha_attempts (created_at);
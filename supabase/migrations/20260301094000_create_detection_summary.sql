@@ -0,0 +1,25 @@
+/*
+  # Detection summary per platform
+
+  Counts bot runs and detected runs per platform over the last p_days
+  days so the dashboard never downloads individual bot_runs rows.
+*/
+
+CREATE OR REPLACE FUNCTION detection_summary(p_days integer DEFAULT 7)
+RETURNS TABLE (
+  platform text,
+  total bigint,
+  detected bigint
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT
+    r.platform,
+    count(*) AS total,
+    count(*) FILTER (WHERE r.detection_triggered) AS detected
+  FROM bot_runs r
+  WHERE r.started_at >= now() - p_days * interval '1 day'
+  GROUP BY r.platform;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_bot_runs_started_at ON bot_runs (started_at);
@@ -0,0 +1,73 @@
+/*
+  # Atomic stat counters
+
+  Account and proxy counters were updated with a SELECT followed by an
+  UPDATE from the client, which took two round-trips and lost increments
+  when two workers updated the same row at once. These functions do the
+  increment in a single statement.
+
+  1. increment_account_stats(p_id, p_success)
+     - Bumps success_count or failure_count, returns false if the account
+       does not exist
+  2. upsert_proxy_perf(p_addr, p_platform, p_success, p_detected, p_rt_ms)
+     - Inserts or increments the proxy's row for the platform and keeps a
+       running average response time
+*/
+
+CREATE OR REPLACE FUNCTION increment_account_stats(p_id uuid, p_success boolean)
+RETURNS boolean
+LANGUAGE sql VOLATILE
+AS $$
+  WITH updated AS (
+    UPDATE accounts
+    SET
+      success_count = coalesce(success_count, 0) + CASE WHEN p_success THEN 1 ELSE 0 END,
+      failure_count = coalesce(failure_count, 0) + CASE WHEN p_success THEN 0 ELSE 1 END
+    WHERE id = p_id
+    RETURNING 1
+  )
+  SELECT EXISTS (SELECT 1 FROM updated);
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_proxy_performance_address_platform
+  ON proxy_performance (proxy_address, platform) NULLS NOT DISTINCT;
+
+CREATE OR REPLACE FUNCTION upsert_proxy_perf(
+  p_addr text,
+  p_platform text,
+  p_success boolean,
+  p_detected boolean DEFAULT false,
+  p_rt_ms integer DEFAULT NULL
+)
+RETURNS void
+LANGUAGE sql VOLATILE
+AS $$
+  INSERT INTO proxy_performance AS p (
+    proxy_address, platform, success_count, failure_count, detection_count,
+    average_response_time_ms, last_tested, last_success
+  )
+  VALUES (
+    p_addr,
+    p_platform,
+    CASE WHEN p_success THEN 1 ELSE 0 END,
+    CASE WHEN p_success THEN 0 ELSE 1 END,
+    CASE WHEN p_detected THEN 1 ELSE 0 END,
+    coalesce(p_rt_ms, 0),
+    now(),
+    CASE WHEN p_success THEN now() END
+  )
+  ON CONFLICT (proxy_address, platform) DO UPDATE SET
+    success_count = coalesce(p.success_count, 0) + EXCLUDED.success_count,
+    failure_count = coalesce(p.failure_count, 0) + EXCLUDED.failure_count,
+    detection_count = coalesce(p.detection_count, 0) + EXCLUDED.detection_count,
+    average_response_time_ms = CASE
+      WHEN p_rt_ms IS NULL THEN p.average_response_time_ms
+      ELSE (
+        (coalesce(p.average_response_time_ms, 0)::bigint
+          * (coalesce(p.success_count, 0) + coalesce(p.failure_count, 0)) + p_rt_ms)
+        / (coalesce(p.success_count, 0) + coalesce(p.failure_count, 0) + 1)
+      )::integer
+    END,
+    last_tested = EXCLUDED.last_tested,
+    last_success = coalesce(EXCLUDED.last_success, p.last_success);
+$$;
@@ -0,0 +1,54 @@
+/*
+  # Server-side CAPTCHA and bot run aggregates
+
+  get_captcha_success_rate and get_bot_run_stats used to download every
+  row in the window and count them in Python. These functions return the
+  aggregates as a single row instead.
+
+  1. get_captcha_success_rate(p_platform, p_days)
+     - Solve rate (0-100) for one platform
+  2. get_bot_run_stats(p_platform, p_bot_type, p_days)
+     - Run, success, CAPTCHA and detection counts plus average duration
+       (ignoring runs without a duration) for one platform and bot type
+*/
+
+CREATE OR REPLACE FUNCTION get_captcha_success_rate(p_platform text, p_days integer DEFAULT 7)
+RETURNS double precision
+LANGUAGE sql STABLE
+AS $$
+  SELECT coalesce(
+    100.0 * count(*) FILTER (WHERE c.success)::double precision / NULLIF(count(*), 0),
+    0
+  )
+  FROM captcha_attempts c
+  WHERE c.platform = p_platform
+    AND c.created_at >= (now() - p_days * interval '1 day')::date;
+$$;
+
+CREATE OR REPLACE FUNCTION get_bot_run_stats(p_platform text, p_bot_type text, p_days integer DEFAULT 7)
+RETURNS TABLE (
+  total_runs bigint,
+  success_count bigint,
+  average_duration_ms double precision,
+  captcha_required_count bigint,
+  detection_triggered_count bigint
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT
+    count(*) AS total_runs,
+    count(*) FILTER (WHERE r.success) AS success_count,
+    coalesce(avg(r.duration_ms) FILTER (WHERE r.duration_ms <> 0), 0) AS average_duration_ms,
+    count(*) FILTER (WHERE r.captcha_required) AS captcha_required_count,
+    count(*) FILTER (WHERE r.detection_triggered) AS detection_triggered_count
+  FROM bot_runs r
+  WHERE r.platform = p_platform
+    AND r.bot_type = p_bot_type
+    AND r.started_at >= (now() - p_days * interval '1 day')::date;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_captcha_attempts_platform_created_at
+  ON captcha_attempts (platform, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_bot_runs_platform_bot_type_started_at
+  ON bot_runs (platform, bot_type, started_at);
@@ -0,0 +1,67 @@
+/*
+  # Batched proxy performance counters
+
+  Bots report proxy results far more often than anyone reads them, and
+  calling upsert_proxy_perf once per event meant one round-trip per
+  request. The client now sums results per proxy in memory and sends
+  them every couple of seconds through this function.
+
+  1. add_proxy_perf_batch(p_rows jsonb)
+     - p_rows is an array of objects with addr, platform, successes,
+       failures, detections, rt_ms_sum, rt_count, last_tested and
+       last_success; each (addr, platform) appears at most once
+     - Inserts or increments each proxy's row, folding rt_ms_sum into the
+       running average response time the same way upsert_proxy_perf does
+*/
+
+CREATE OR REPLACE FUNCTION add_proxy_perf_batch(p_rows jsonb)
+RETURNS void
+LANGUAGE plpgsql VOLATILE
+AS $$
+DECLARE
+  r record;
+BEGIN
+  FOR r IN
+    SELECT * FROM jsonb_to_recordset(p_rows) AS x(
+      addr text,
+      platform text,
+      successes integer,
+      failures integer,
+      detections integer,
+      rt_ms_sum bigint,
+      rt_count integer,
+      last_tested timestamptz,
+      last_success timestamptz
+    )
+  LOOP
+    INSERT INTO proxy_performance AS p (
+      proxy_address, platform, success_count, failure_count, detection_count,
+      average_response_time_ms, last_tested, last_success
+    )
+    VALUES (
+      r.addr,
+      r.platform,
+      r.successes,
+      r.failures,
+      r.detections,
+      CASE WHEN r.rt_count > 0 THEN (r.rt_ms_sum / r.rt_count)::integer ELSE 0 END,
+      r.last_tested,
+      r.last_success
+    )
+    ON CONFLICT (proxy_address, platform) DO UPDATE SET
+      success_count = coalesce(p.success_count, 0) + r.successes,
+      failure_count = coalesce(p.failure_count, 0) + r.failures,
+      detection_count = coalesce(p.detection_count, 0) + r.detections,
+      average_response_time_ms = CASE
+        WHEN r.rt_count = 0 THEN p.average_response_time_ms
+        ELSE (
+          (coalesce(p.average_response_time_ms, 0)::bigint
+            * (coalesce(p.success_count, 0) + coalesce(p.failure_count, 0)) + r.rt_ms_sum)
+          / (coalesce(p.success_count, 0) + coalesce(p.failure_count, 0) + r.rt_count)
+        )::integer
+      END,
+      last_tested = r.last_tested,
+      last_success = coalesce(r.last_success, p.last_success);
+  END LOOP;
+END;
+$$;
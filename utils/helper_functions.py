@@ -3,46 +3,147 @@ Helper Functions for SneakerBot Ultimate
 Utility functions for common bot operations
 """
 
+import asyncio
 import random
 import string
 import time
 import hashlib
+import hmac
 import json
+import os
 import re
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from urllib.parse import urlencode
 from faker import Faker
 from user_agents import parse
 
+from utils.logger import logger
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHash, VerificationError
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+
+try:
+    from fastpbkdf2 import pbkdf2_hmac
+except ImportError:
+    from hashlib import pbkdf2_hmac
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    from bs4 import BeautifulSoup, SoupStrainer  # only needed without selectolax
+
+try:
+    import lxml  # noqa: F401  (C-backed tree builder for BeautifulSoup)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
 fake = Faker()
 
+# Validation / parsing patterns, compiled once
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_ZIP_RE = re.compile(r'^\d{5}(-\d{4})?$')
+_CLEAN_CHARS_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'\s+')
+_NON_PRICE_RE = re.compile(r'[^\d.]')
+_DOMAIN_RE = re.compile(r'https?://(?:www\.)?([^/]+)')
+
+# Deletes every Latin-1 character except ASCII digits and '.'
+_PRICE_TABLE = str.maketrans('', '', ''.join(chr(b) for b in range(256) if chr(b) not in '0123456789.'))
+
 
 # ========================================
 # Email & Identity Generation
 # ========================================
 
-def generate_random_email(domain=None):
-    """Generates a random email for sneaker raffle entries."""
-    if domain:
-        domains = [domain]
-    else:
-        domains = ["gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com"]
-    
-    # Generate realistic looking names
-    first_name = fake.first_name().lower()
-    last_name = fake.last_name().lower()
+EMAIL_DOMAINS = ("gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com")
+IDENTITY_POOL_SIZE = 2000
+
+_identity_pools = None
+
+
+def _get_identity_pools():
+    """
+    Sample pools of Faker values, built once on first use
     
-    # Various email patterns
-    patterns = [
-        f"{first_name}.{last_name}",
-        f"{first_name}{last_name}",
-        f"{first_name}_{last_name}",
-        f"{first_name}{random.randint(100, 999)}",
-        f"{first_name}.{last_name}{random.randint(10, 99)}",
-    ]
+    Faker's providers are slow per call, so bulk generators draw from
+    these pools with random.choices instead of calling Faker per identity.
+    """
+    global _identity_pools
+    if _identity_pools is None:
+        size = IDENTITY_POOL_SIZE
+        _identity_pools = {
+            "first_name": [fake.first_name() for _ in range(size)],
+            "last_name": [fake.last_name() for _ in range(size)],
+            "street_address": [fake.street_address() for _ in range(size)],
+            "secondary_address": [fake.secondary_address() for _ in range(size // 4)],
+            "city": [fake.city() for _ in range(size)],
+            "state": [fake.state_abbr() for _ in range(size // 4)],
+            "zip_code": [fake.zipcode() for _ in range(size)],
+        }
+    return _identity_pools
+
+
+def generate_random_emails(n, domain=None):
+    """
+    Generate n random emails for sneaker raffle entries
     
-    username = random.choice(patterns)
-    email = f"{username}@{random.choice(domains)}"
-    return email
+    Args:
+        n: Number of emails
+        domain: Use this domain instead of a random common provider
+        
+    Returns:
+        list: Email addresses
+    """
+    pools = _get_identity_pools()
+    firsts = random.choices(pools["first_name"], k=n)
+    lasts = random.choices(pools["last_name"], k=n)
+    domains = [domain] * n if domain else random.choices(EMAIL_DOMAINS, k=n)
+    
+    emails = []
+    for first_name, last_name, email_domain in zip(firsts, lasts, domains):
+        first_name = first_name.lower()
+        last_name = last_name.lower()
+        
+        # Various email patterns
+        pattern = random.randrange(5)
+        if pattern == 0:
+            username = f"{first_name}.{last_name}"
+        elif pattern == 1:
+            username = f"{first_name}{last_name}"
+        elif pattern == 2:
+            username = f"{first_name}_{last_name}"
+        elif pattern == 3:
+            username = f"{first_name}{random.randint(100, 999)}"
+        else:
+            username = f"{first_name}.{last_name}{random.randint(10, 99)}"
+        
+        emails.append(f"{username}@{email_domain}")
+    return emails
+
+
+def generate_random_email(domain=None):
+    """Generates a random email for sneaker raffle entries."""
+    return generate_random_emails(1, domain)[0]
 
 
 def generate_random_name():
@@ -58,77 +159,104 @@ def generate_random_phone():
     return fake.phone_number()
 
 
+def generate_random_addresses(n):
+    """
+    Generate n random US addresses
+    
+    Returns:
+        list: Address dicts
+    """
+    pools = _get_identity_pools()
+    streets = random.choices(pools["street_address"], k=n)
+    cities = random.choices(pools["city"], k=n)
+    states = random.choices(pools["state"], k=n)
+    zip_codes = random.choices(pools["zip_code"], k=n)
+    secondaries = pools["secondary_address"]
+    
+    return [
+        {
+            "address_line1": street,
+            "address_line2": random.choice(secondaries) if random.random() > 0.7 else "",
+            "city": city,
+            "state": state,
+            "zip_code": zip_code,
+            "country": "US"
+        }
+        for street, city, state, zip_code in zip(streets, cities, states, zip_codes)
+    ]
+
+
 def generate_random_address():
     """Generate random US address"""
-    return {
-        "address_line1": fake.street_address(),
-        "address_line2": fake.secondary_address() if random.random() > 0.7 else "",
-        "city": fake.city(),
-        "state": fake.state_abbr(),
-        "zip_code": fake.zipcode(),
-        "country": "US"
-    }
+    return generate_random_addresses(1)[0]
 
 
 # ========================================
 # Browser Fingerprinting & Stealth
 # ========================================
 
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+_SCREEN_RESOLUTIONS = ((1920, 1080), (2560, 1440), (1366, 768), (1440, 900), (1536, 864))
+_COLOR_DEPTHS = (24, 32)
+_TIMEZONE_OFFSETS = (-480, -420, -360, -300, -240, -180)
+_PLATFORMS = ("Win32", "MacIntel", "Linux x86_64")
+_LANGUAGES = ("en-US", "en-GB", "en-CA")
+_HARDWARE_CONCURRENCY = (4, 8, 12, 16)
+_DEVICE_MEMORY = (4, 8, 16, 32)
+
+
 def generate_user_agent():
     """Generate random but realistic user agent"""
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    ]
-    return random.choice(user_agents)
+    return random.choice(_USER_AGENTS)
 
 
 def generate_browser_fingerprint():
     """Generate randomized browser fingerprint data"""
-    screen_resolutions = [
-        (1920, 1080), (2560, 1440), (1366, 768), (1440, 900), (1536, 864)
-    ]
-    
+    choice = random.choice
     return {
-        "screen_resolution": random.choice(screen_resolutions),
-        "color_depth": random.choice([24, 32]),
-        "timezone_offset": random.choice([-480, -420, -360, -300, -240, -180]),
-        "platform": random.choice(["Win32", "MacIntel", "Linux x86_64"]),
-        "language": random.choice(["en-US", "en-GB", "en-CA"]),
-        "hardware_concurrency": random.choice([4, 8, 12, 16]),
-        "device_memory": random.choice([4, 8, 16, 32]),
+        "screen_resolution": choice(_SCREEN_RESOLUTIONS),
+        "color_depth": choice(_COLOR_DEPTHS),
+        "timezone_offset": choice(_TIMEZONE_OFFSETS),
+        "platform": choice(_PLATFORMS),
+        "language": choice(_LANGUAGES),
+        "hardware_concurrency": choice(_HARDWARE_CONCURRENCY),
+        "device_memory": choice(_DEVICE_MEMORY),
     }
 
 
 def generate_canvas_fingerprint():
     """Generate unique canvas fingerprint"""
-    return hashlib.md5(str(random.random()).encode()).hexdigest()
+    return secrets.token_hex(16)
 
 
 # ========================================
 # Request Headers & HTTP Utilities
 # ========================================
 
+_BASE_HEADERS = MappingProxyType({
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+})
+
+
 def generate_request_headers(referer=None, accept_language="en-US,en;q=0.9"):
     """Generate realistic HTTP request headers"""
-    user_agent = generate_user_agent()
-    
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": accept_language,
-        "Accept-Encoding": "gzip, deflate, br",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Cache-Control": "max-age=0",
-    }
+    headers = {"User-Agent": random.choice(_USER_AGENTS), **_BASE_HEADERS}
+    headers["Accept-Language"] = accept_language  # keeps its place in the header order
     
     if referer:
         headers["Referer"] = referer
@@ -138,14 +266,12 @@ def generate_request_headers(referer=None, accept_language="en-US,en;q=0.9"):
 
 def randomize_headers(base_headers):
     """Add randomized headers to avoid detection"""
-    additional_headers = {
-        "X-Requested-With": "XMLHttpRequest" if random.random() > 0.5 else None,
-        "Pragma": "no-cache" if random.random() > 0.3 else None,
-    }
-    
-    # Merge and remove None values
-    merged = {**base_headers, **additional_headers}
-    return {k: v for k, v in merged.items() if v is not None}
+    headers = dict(base_headers)
+    if random.random() > 0.5:
+        headers["X-Requested-With"] = "XMLHttpRequest"
+    if random.random() > 0.3:
+        headers["Pragma"] = "no-cache"
+    return headers
 
 
 # ========================================
@@ -159,6 +285,13 @@ def random_delay(min_delay=1, max_delay=3):
     return delay
 
 
+async def random_delay_async(min_delay=1, max_delay=3):
+    """Sleep for a random amount of time without blocking the event loop"""
+    delay = random.uniform(min_delay, max_delay)
+    await asyncio.sleep(delay)
+    return delay
+
+
 def human_typing_delay(text, wpm=60):
     """Simulate human typing speed
     
@@ -166,15 +299,8 @@ def human_typing_delay(text, wpm=60):
         text: The text being typed
         wpm: Words per minute (average human types 40-60 wpm)
     """
-    # Calculate delay per character
-    chars_per_second = (wpm * 5) / 60  # 5 chars per word average
-    delay_per_char = 1 / chars_per_second
-    
-    total_delay = len(text) * delay_per_char
-    # Add some randomness
-    total_delay *= random.uniform(0.8, 1.2)
-    
-    return total_delay
+    # 60 / (wpm * 5) seconds per character (5 chars per word average) is 12 / wpm
+    return len(text) * 12.0 / wpm * random.uniform(0.8, 1.2)
 
 
 def exponential_backoff(attempt, base_delay=1, max_delay=60):
@@ -197,28 +323,26 @@ def exponential_backoff(attempt, base_delay=1, max_delay=60):
 
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_phone(phone):
     """Validate US phone number"""
     # Remove all non-digits
-    digits = re.sub(r'\D', '', phone)
+    digits = _NON_DIGIT_RE.sub('', phone)
     return len(digits) == 10 or len(digits) == 11
 
 
 def validate_zip_code(zip_code):
     """Validate US zip code"""
-    pattern = r'^\d{5}(-\d{4})?$'
-    return re.match(pattern, zip_code) is not None
+    return _ZIP_RE.match(zip_code) is not None
 
 
 def sanitize_sneaker_name(name):
     """Clean up sneaker name for searching"""
     # Remove special characters, normalize spaces
-    cleaned = re.sub(r'[^\w\s-]', '', name)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _CLEAN_CHARS_RE.sub('', name)
+    cleaned = _WS_RE.sub(' ', cleaned).strip()
     return cleaned
 
 
@@ -226,12 +350,16 @@ def sanitize_sneaker_name(name):
 # Price & Currency Utilities
 # ========================================
 
+@lru_cache(maxsize=4096)
 def parse_price(price_string):
     """Extract numeric price from string"""
-    # Remove currency symbols and commas
-    price_str = re.sub(r'[^\d.]', '', price_string)
+    # Remove currency symbols and commas; symbols outside Latin-1 (e.g. €) go through the regex
     try:
-        return float(price_str)
+        return float(price_string.translate(_PRICE_TABLE))
+    except ValueError:
+        pass
+    try:
+        return float(_NON_PRICE_RE.sub('', price_string))
     except ValueError:
         return None
 
@@ -264,28 +392,38 @@ def normalize_size(size):
         return size_str
 
 
+_EU_SIZE_OFFSETS = {"men": 33, "women": 30.5}
+
+
 def us_to_eu_size(us_size, gender="men"):
     """Convert US shoe size to EU size"""
-    conversion = {
-        "men": lambda x: x + 33,
-        "women": lambda x: x + 30.5,
-    }
-    
-    converter = conversion.get(gender, conversion["men"])
+    offset = _EU_SIZE_OFFSETS.get(gender, _EU_SIZE_OFFSETS["men"])
     try:
-        return converter(float(us_size))
+        return float(us_size) + offset
     except (ValueError, TypeError):
         return None
 
 
+def us_to_eu_sizes(us_sizes, gender="men"):
+    """Convert a list of US shoe sizes to EU sizes (None for unparseable entries)"""
+    offset = _EU_SIZE_OFFSETS.get(gender, _EU_SIZE_OFFSETS["men"])
+    eu_sizes = []
+    for us_size in us_sizes:
+        try:
+            eu_sizes.append(float(us_size) + offset)
+        except (ValueError, TypeError):
+            eu_sizes.append(None)
+    return eu_sizes
+
+
 # ========================================
 # URL & Domain Utilities
 # ========================================
 
+@lru_cache(maxsize=4096)
 def extract_domain(url):
     """Extract domain from URL"""
-    pattern = r'https?://(?:www\.)?([^/]+)'
-    match = re.search(pattern, url)
+    match = _DOMAIN_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -294,8 +432,7 @@ def build_url(base_url, path, params=None):
     url = base_url.rstrip('/') + '/' + path.lstrip('/')
     
     if params:
-        query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-        url += '?' + query_string
+        url += '?' + urlencode(params, doseq=True)
     
     return url
 
@@ -304,61 +441,119 @@ def build_url(base_url, path, params=None):
 # Web Scraping Helpers
 # ========================================
 
+def _node_classes(node):
+    """Class list of a selectolax node, matching BeautifulSoup's multi-valued attribute"""
+    classes = node.attributes.get('class')
+    return classes.split() if classes else None
+
+
 def extract_site_structure(html_content):
     """Extract relevant information from HTML for bot operation"""
-    from bs4 import BeautifulSoup
+    if not SELECTOLAX_AVAILABLE:
+        return _extract_site_structure_bs4(html_content)
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    tree = HTMLParser(html_content)
     
-    structure = {
-        "forms": [],
-        "buttons": [],
-        "inputs": [],
+    return {
+        "forms": [
+            {
+                "action": form.attributes.get('action'),
+                "method": form.attributes.get('method'),
+                "id": form.attributes.get('id'),
+                "class": _node_classes(form)
+            }
+            for form in tree.css('form')
+        ],
+        "buttons": [
+            {
+                "text": button.text(strip=True),
+                "id": button.attributes.get('id'),
+                "class": _node_classes(button),
+                "type": button.attributes.get('type')
+            }
+            for button in tree.css('button')
+        ],
+        "inputs": [
+            {
+                "name": input_field.attributes.get('name'),
+                "type": input_field.attributes.get('type'),
+                "id": input_field.attributes.get('id'),
+                "class": _node_classes(input_field)
+            }
+            for input_field in tree.css('input')
+        ],
         "links": []
     }
+
+
+def _extract_site_structure_bs4(html_content):
+    # Only build tree nodes for the tags we read
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=SoupStrainer(['form', 'button', 'input']))
     
-    # Extract forms
-    for form in soup.find_all('form'):
-        structure["forms"].append({
-            "action": form.get('action'),
-            "method": form.get('method'),
-            "id": form.get('id'),
-            "class": form.get('class')
-        })
-    
-    # Extract buttons
-    for button in soup.find_all('button'):
-        structure["buttons"].append({
-            "text": button.get_text(strip=True),
-            "id": button.get('id'),
-            "class": button.get('class'),
-            "type": button.get('type')
-        })
-    
-    # Extract inputs
-    for input_field in soup.find_all('input'):
-        structure["inputs"].append({
-            "name": input_field.get('name'),
-            "type": input_field.get('type'),
-            "id": input_field.get('id'),
-            "class": input_field.get('class')
-        })
-    
-    return structure
+    return {
+        "forms": [
+            {
+                "action": form.get('action'),
+                "method": form.get('method'),
+                "id": form.get('id'),
+                "class": form.get('class')
+            }
+            for form in soup.find_all('form')
+        ],
+        "buttons": [
+            {
+                "text": button.get_text(strip=True),
+                "id": button.get('id'),
+                "class": button.get('class'),
+                "type": button.get('type')
+            }
+            for button in soup.find_all('button')
+        ],
+        "inputs": [
+            {
+                "name": input_field.get('name'),
+                "type": input_field.get('type'),
+                "id": input_field.get('id'),
+                "class": input_field.get('class')
+            }
+            for input_field in soup.find_all('input')
+        ],
+        "links": []
+    }
 
 
 def find_element_by_text(html_content, text, tag='button'):
     """Find HTML element by its text content"""
-    from bs4 import BeautifulSoup
+    if not SELECTOLAX_AVAILABLE:
+        return _find_element_by_text_bs4(html_content, text, tag)
+    
+    needle = text.lower()
+    for node in HTMLParser(html_content).css(tag):
+        node_text = node.text(strip=True)
+        if needle in node_text.lower():
+            element_id = node.attributes.get('id')
+            classes = _node_classes(node)
+            return {
+                "tag": tag,
+                "text": node_text,
+                "id": element_id,
+                "class": classes,
+                "selector": _css_selector(node.tag, element_id, classes)
+            }
     
-    soup = BeautifulSoup(html_content, 'html.parser')
-    elements = soup.find_all(tag)
+    return None
+
+
+def _find_element_by_text_bs4(html_content, text, tag):
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=SoupStrainer(tag))
+    needle = text.lower()
     
-    for element in elements:
-        if text.lower() in element.get_text(strip=True).lower():
+    for element in soup.find_all(tag):
+        element_text = element.get_text(strip=True)
+        if needle in element_text.lower():
             return {
                 "tag": tag,
-                "text": element.get_text(strip=True),
+                "text": element_text,
                 "id": element.get('id'),
                 "class": element.get('class'),
                 "selector": generate_css_selector(element)
@@ -367,43 +562,68 @@ def find_element_by_text(html_content, text, tag='button'):
     return None
 
 
-def generate_css_selector(element):
-    """Generate CSS selector for BeautifulSoup element"""
-    if element.get('id'):
-        return f"#{element['id']}"
+def _css_selector(tag_name, element_id, classes):
+    if element_id:
+        return f"#{element_id}"
     
-    if element.get('class'):
-        classes = '.'.join(element['class'])
-        return f"{element.name}.{classes}"
+    if classes:
+        if len(classes) == 1:  # most elements; skips the join
+            return f"{tag_name}.{classes[0]}"
+        return f"{tag_name}.{'.'.join(classes)}"
     
-    return element.name
+    return tag_name
+
+
+def generate_css_selector(element):
+    """Generate CSS selector for BeautifulSoup element"""
+    return _css_selector(element.name, element.get('id'), element.get('class'))
 
 
 # ========================================
 # Security & Hashing
 # ========================================
 
+_password_hasher = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4) if ARGON2_AVAILABLE else None
+
+
+def _derive(password, salt):
+    """Raw PBKDF2-SHA256 key for a password and salt"""
+    return pbkdf2_hmac('sha256', password.encode(), salt.encode(), 100000)
+
+
 def hash_password(password, salt=None):
-    """Hash password with salt"""
-    if not salt:
-        salt = hashlib.sha256(str(random.random()).encode()).hexdigest()[:16]
+    """Hash password with Argon2id
     
-    hashed = hashlib.pbkdf2_hmac('sha256', password.encode(), salt.encode(), 100000)
-    return f"{salt}${hashed.hex()}"
+    Falls back to salted PBKDF2-SHA256 (salt$hash) when argon2-cffi isn't
+    installed or an explicit salt is given.
+    """
+    if salt is None and ARGON2_AVAILABLE:
+        return _password_hasher.hash(password)
+    salt = salt or secrets.token_hex(8)
+    return f"{salt}${_derive(password, salt).hex()}"
 
 
 def verify_password(password, hashed):
-    """Verify password against hash"""
+    """Verify password against an Argon2id or older PBKDF2 hash"""
+    if hashed.startswith('$argon2'):
+        if not ARGON2_AVAILABLE:
+            return False
+        try:
+            return _password_hasher.verify(hashed, password)
+        except (VerificationError, InvalidHash):
+            return False
+    
     try:
         salt, hash_value = hashed.split('$')
-        return hash_password(password, salt) == hashed
+        expected = bytes.fromhex(hash_value)
     except ValueError:
         return False
+    return hmac.compare_digest(_derive(password, salt), expected)
 
 
 def generate_session_token():
     """Generate random session token"""
-    return hashlib.sha256(str(time.time()).encode()).hexdigest()
+    return hashlib.blake2b(secrets.token_bytes(32), digest_size=32).hexdigest()
 
 
 # ========================================
@@ -412,19 +632,44 @@ def generate_session_token():
 
 def ensure_directory(path):
     """Create directory if it doesn't exist"""
-    import os
     os.makedirs(path, exist_ok=True)
     return path
 
 
+_filename_ts = (0, "")
+
+
+def _filename_timestamp():
+    """Local timestamp for filenames, formatted once per second"""
+    global _filename_ts
+    now = int(time.time())
+    if now != _filename_ts[0]:
+        _filename_ts = (now, datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S"))
+    return _filename_ts[1]
+
+
 def generate_filename(prefix, extension, include_timestamp=True):
     """Generate unique filename"""
     if include_timestamp:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{prefix}_{timestamp}.{extension}"
+        return f"{prefix}_{_filename_timestamp()}.{extension}"
     return f"{prefix}.{extension}"
 
 
+_screenshot_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot-writer")
+
+
+def _write_file(filepath, content):
+    with open(filepath, 'wb') as f:
+        f.write(content)
+
+
+def _log_write_error(future, filepath):
+    """Report a failed background write, which would otherwise vanish with its future"""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to save screenshot {filepath}: {error}")
+
+
 def save_screenshot(driver, filename=None):
     """Save screenshot with automatic naming"""
     if not filename:
@@ -432,7 +677,9 @@ def save_screenshot(driver, filename=None):
     
     ensure_directory("screenshots")
     filepath = f"screenshots/{filename}"
-    driver.save_screenshot(filepath)
+    # Only the capture blocks; the file is written on a background thread
+    future = _screenshot_writer.submit(_write_file, filepath, driver.get_screenshot_as_png())
+    future.add_done_callback(lambda fut: _log_write_error(fut, filepath))
     return filepath
 
 
@@ -440,16 +687,26 @@ def save_screenshot(driver, filename=None):
 # Data Serialization
 # ========================================
 
+def _dumps_pretty(data):
+    """Indented JSON as UTF-8 bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
 def serialize_to_json(data, filepath):
     """Save data to JSON file"""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(_dumps_pretty(data))
 
 
 def deserialize_from_json(filepath):
     """Load data from JSON file"""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        content = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 # ========================================
@@ -458,12 +715,12 @@ def deserialize_from_json(filepath):
 
 def measure_execution_time(func):
     """Decorator to measure function execution time"""
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
-        print(f"⏱️  {func.__name__} executed in {execution_time:.2f} seconds")
+        execution_time = time.perf_counter() - start_time
+        print(f"⏱️  {func.__name__} executed in {execution_time:.4f} seconds")
         return result
     return wrapper
 
@@ -517,7 +774,7 @@ def generate_test_data():
 def print_test_data():
     """Print formatted test data"""
     data = generate_test_data()
-    print(json.dumps(data, indent=2))
+    print(_dumps_pretty(data).decode())
 
 
 if __name__ == "__main__":
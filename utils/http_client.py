@@ -0,0 +1,69 @@
+"""
+HTTP Client Helpers for SneakerBot Ultimate
+Pooled keep-alive sessions for webhook, proxy and raffle requests
+"""
+
+import threading
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_http2_client = None
+_http2_client_lock = threading.Lock()
+
+
+def create_session(pool_connections=32, pool_maxsize=64, retries=2, backoff_factor=0.3):
+    """
+    Create a requests session that keeps connections alive between calls
+
+    Args:
+        pool_connections: Number of hosts to keep connection pools for
+        pool_maxsize: Max connections kept per host
+        retries: Retries on connection errors and 5xx responses
+        backoff_factor: Backoff multiplier between retries
+
+    Returns:
+        requests.Session: Session with pooled adapters mounted
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http2_client():
+    """
+    Get the shared HTTP/2 client for outbound API calls
+
+    Requests to the same host (Discord, Telegram) are multiplexed over one
+    connection and reuse its TLS session for the life of the process.
+
+    Returns:
+        httpx.Client: Thread-safe pooled client
+    """
+    global _http2_client
+    with _http2_client_lock:
+        if _http2_client is None:
+            _http2_client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(10.0, connect=3.0),
+            )
+    return _http2_client
@@ -3,10 +3,12 @@ Enhanced Logging System for SneakerBot Ultimate
 Provides colored console output and file logging with rotation
 """
 
+import atexit
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
+from queue import SimpleQueue
 import os
 
 # Color codes for terminal output
@@ -46,6 +48,9 @@ def setup_logger(name="SneakerBot", level=logging.INFO, log_file="bot.log"):
     """
     Set up logger with both file and console handlers
     
+    The handlers are driven by a background QueueListener, so file writes
+    and rotation never block the thread that logged the record.
+    
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -88,9 +93,13 @@ def setup_logger(name="SneakerBot", level=logging.INFO, log_file="bot.log"):
     console_handler.setLevel(level)
     console_handler.setFormatter(console_format)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Handlers run on a listener thread so callers only pay for enqueueing the record
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # drains queued records before exit
+    
+    logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
@@ -130,31 +139,31 @@ def log_critical(message, *args, **kwargs):
 
 def log_success(message):
     """Log success message with special formatting"""
-    logger.info(f"✅ {message}")
+    logger.info("✅ %s", message)
 
 
 def log_failure(message):
     """Log failure message with special formatting"""
-    logger.error(f"❌ {message}")
+    logger.error("❌ %s", message)
 
 
 def log_progress(current, total, prefix="Progress"):
     """Log progress message"""
     percentage = (current / total) * 100 if total > 0 else 0
-    logger.info(f"{prefix}: {current}/{total} ({percentage:.1f}%)")
+    logger.info("%s: %s/%s (%.1f%%)", prefix, current, total, percentage)
 
 
 def log_task_start(task_name):
     """Log task start"""
-    logger.info(f"🚀 Starting task: {task_name}")
+    logger.info("🚀 Starting task: %s", task_name)
 
 
 def log_task_end(task_name, success=True):
     """Log task completion"""
     if success:
-        logger.info(f"✅ Task completed: {task_name}")
+        logger.info("✅ Task completed: %s", task_name)
     else:
-        logger.error(f"❌ Task failed: {task_name}")
+        logger.error("❌ Task failed: %s", task_name)
 
 
 def log_separator():
@@ -165,7 +174,7 @@ def log_separator():
 def log_section(section_name):
     """Log section header"""
     log_separator()
-    logger.info(f"  {section_name.upper()}")
+    logger.info("  %s", section_name.upper())
     log_separator()
 
 
@@ -182,53 +191,53 @@ def log_bot_action(action, platform, details=None):
         platform: Platform name (Nike, Adidas, etc.)
         details: Optional additional details
     """
-    message = f"[{platform}] {action}"
     if details:
-        message += f" - {details}"
-    logger.info(message)
+        logger.info("[%s] %s - %s", platform, action, details)
+    else:
+        logger.info("[%s] %s", platform, action)
 
 
 def log_captcha_event(platform, captcha_type, success):
     """Log CAPTCHA solving event"""
     status = "✅ Solved" if success else "❌ Failed"
-    logger.info(f"[{platform}] CAPTCHA ({captcha_type}): {status}")
+    logger.info("[%s] CAPTCHA (%s): %s", platform, captcha_type, status)
 
 
 def log_proxy_event(proxy, success):
     """Log proxy usage"""
     status = "✅ Working" if success else "❌ Failed"
-    logger.debug(f"Proxy {proxy}: {status}")
+    logger.debug("Proxy %s: %s", proxy, status)
 
 
 def log_queue_event(platform, status):
     """Log queue status"""
-    logger.info(f"[{platform}] Queue Status: {status}")
+    logger.info("[%s] Queue Status: %s", platform, status)
 
 
 def log_purchase_attempt(platform, sneaker_name, size):
     """Log purchase attempt"""
-    logger.info(f"🛒 [{platform}] Attempting purchase: {sneaker_name} (Size: {size})")
+    logger.info("🛒 [%s] Attempting purchase: %s (Size: %s)", platform, sneaker_name, size)
 
 
 def log_purchase_success(platform, sneaker_name, order_number=None):
     """Log successful purchase"""
-    message = f"🎉 [{platform}] Successfully purchased: {sneaker_name}"
     if order_number:
-        message += f" (Order: {order_number})"
-    logger.info(message)
+        logger.info("🎉 [%s] Successfully purchased: %s (Order: %s)", platform, sneaker_name, order_number)
+    else:
+        logger.info("🎉 [%s] Successfully purchased: %s", platform, sneaker_name)
 
 
 def log_purchase_failure(platform, sneaker_name, reason=None):
     """Log failed purchase"""
-    message = f"❌ [{platform}] Failed to purchase: {sneaker_name}"
     if reason:
-        message += f" - Reason: {reason}"
-    logger.error(message)
+        logger.error("❌ [%s] Failed to purchase: %s - Reason: %s", platform, sneaker_name, reason)
+    else:
+        logger.error("❌ [%s] Failed to purchase: %s", platform, sneaker_name)
 
 
 def log_stock_alert(platform, sneaker_name):
     """Log stock availability alert"""
-    logger.info(f"🔥 [{platform}] IN STOCK: {sneaker_name}")
+    logger.info("🔥 [%s] IN STOCK: %s", platform, sneaker_name)
 
 
 # ========================================
@@ -237,12 +246,12 @@ def log_stock_alert(platform, sneaker_name):
 
 def log_performance_metric(metric_name, value, unit="ms"):
     """Log performance metric"""
-    logger.debug(f"⏱️  {metric_name}: {value:.2f} {unit}")
+    logger.debug("⏱️  %s: %.2f %s", metric_name, value, unit)
 
 
 def log_timing(operation, duration):
     """Log operation timing"""
-    logger.debug(f"⏱️  {operation} took {duration:.2f} seconds")
+    logger.debug("⏱️  %s took %.2f seconds", operation, duration)
 
 
 # ========================================
@@ -257,11 +266,10 @@ def log_exception(exception, context=None):
         exception: The exception object
         context: Optional context information
     """
-    message = f"Exception occurred: {type(exception).__name__}: {str(exception)}"
     if context:
-        message = f"[{context}] {message}"
-    
-    logger.exception(message)
+        logger.exception("[%s] Exception occurred: %s: %s", context, type(exception).__name__, exception)
+    else:
+        logger.exception("Exception occurred: %s: %s", type(exception).__name__, exception)
 
 
 def log_error_with_context(error_message, context_data):
@@ -272,9 +280,9 @@ def log_error_with_context(error_message, context_data):
         error_message: Error message
         context_data: Dictionary of context information
     """
-    logger.error(f"{error_message}")
+    logger.error("%s", error_message)
     for key, value in context_data.items():
-        logger.error(f"  {key}: {value}")
+        logger.error("  %s: %s", key, value)
 
 
 # ========================================
@@ -292,7 +300,7 @@ class SessionLogger:
     def __enter__(self):
         self.start_time = datetime.now()
         log_separator()
-        logger.info(f"🎯 Starting session: {self.session_name} ({self.platform})")
+        logger.info("🎯 Starting session: %s (%s)", self.session_name, self.platform)
         log_separator()
         return self
     
@@ -300,12 +308,12 @@ class SessionLogger:
         duration = (datetime.now() - self.start_time).total_seconds()
         
         if exc_type is None:
-            logger.info(f"✅ Session completed: {self.session_name}")
+            logger.info("✅ Session completed: %s", self.session_name)
         else:
-            logger.error(f"❌ Session failed: {self.session_name}")
-            logger.exception(f"Error: {exc_val}")
+            logger.error("❌ Session failed: %s", self.session_name)
+            logger.exception("Error: %s", exc_val)
         
-        logger.info(f"⏱️  Session duration: {duration:.2f} seconds")
+        logger.info("⏱️  Session duration: %.2f seconds", duration)
         log_separator()
         
         # Don't suppress exceptions
@@ -319,55 +327,59 @@ class SessionLogger:
 class StatisticsLogger:
     """Track and log statistics"""
     
+    __slots__ = (
+        'total_attempts', 'successes', 'failures',
+        'captchas_solved', 'captchas_failed',
+        'proxies_used', 'proxies_failed',
+    )
+    
     def __init__(self):
-        self.stats = {
-            'total_attempts': 0,
-            'successes': 0,
-            'failures': 0,
-            'captchas_solved': 0,
-            'captchas_failed': 0,
-            'proxies_used': 0,
-            'proxies_failed': 0,
-        }
+        for name in self.__slots__:
+            setattr(self, name, 0)
+    
+    @property
+    def stats(self):
+        """Counters as a dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
     
     def record_attempt(self):
-        self.stats['total_attempts'] += 1
+        self.total_attempts += 1
     
     def record_success(self):
-        self.stats['successes'] += 1
+        self.successes += 1
     
     def record_failure(self):
-        self.stats['failures'] += 1
+        self.failures += 1
     
     def record_captcha(self, success):
         if success:
-            self.stats['captchas_solved'] += 1
+            self.captchas_solved += 1
         else:
-            self.stats['captchas_failed'] += 1
+            self.captchas_failed += 1
     
     def record_proxy(self, success):
-        self.stats['proxies_used'] += 1
+        self.proxies_used += 1
         if not success:
-            self.stats['proxies_failed'] += 1
+            self.proxies_failed += 1
     
     def get_success_rate(self):
-        if self.stats['total_attempts'] == 0:
+        if self.total_attempts == 0:
             return 0.0
-        return (self.stats['successes'] / self.stats['total_attempts']) * 100
+        return (self.successes / self.total_attempts) * 100
     
     def log_summary(self):
         """Log statistics summary"""
         log_separator()
         logger.info("📊 SESSION STATISTICS")
         log_separator()
-        logger.info(f"Total Attempts: {self.stats['total_attempts']}")
-        logger.info(f"Successes: {self.stats['successes']}")
-        logger.info(f"Failures: {self.stats['failures']}")
-        logger.info(f"Success Rate: {self.get_success_rate():.1f}%")
-        logger.info(f"CAPTCHAs Solved: {self.stats['captchas_solved']}")
-        logger.info(f"CAPTCHAs Failed: {self.stats['captchas_failed']}")
-        logger.info(f"Proxies Used: {self.stats['proxies_used']}")
-        logger.info(f"Proxies Failed: {self.stats['proxies_failed']}")
+        logger.info("Total Attempts: %s", self.total_attempts)
+        logger.info("Successes: %s", self.successes)
+        logger.info("Failures: %s", self.failures)
+        logger.info("Success Rate: %.1f%%", self.get_success_rate())
+        logger.info("CAPTCHAs Solved: %s", self.captchas_solved)
+        logger.info("CAPTCHAs Failed: %s", self.captchas_failed)
+        logger.info("Proxies Used: %s", self.proxies_used)
+        logger.info("Proxies Failed: %s", self.proxies_failed)
         log_separator()
 
 